@@ -1,29 +1,132 @@
 """FastAPI 服务 - RAG 多轮对话 API"""
 
+import asyncio
+import functools
+import json
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 
 from api.models import ChatRequest, ChatResponse
 from src.services.rag_chat_service import RAGChatService
 
-# 加载环境变量
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+# 线程池 - 将阻塞的 embedding/LLM 调用移出事件循环
+executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RAG_CHAT_WORKERS", "8")),
+    thread_name_prefix="rag-chat",
 )
-logger = logging.getLogger(__name__)
+
+# 预热查询 - 启动后在后台跑几条有代表性的查询，
+# 提前填充 HNSW 索引页、tokenizer 缓存和查询 embedding 缓存
+_WARMUP_QUERIES = [
+    "你好",
+    "什么是向量数据库？",
+    "如何使用这个系统？",
+]
+
+
+# gunicorn 预加载路径：master 进程在 fork 前调用 build_service()（见
+# gunicorn_conf.py 的 on_starting 钩子），结果存在这里；fork 后 worker
+# 的 lifespan 再调 build_service() 时直接复用，模型权重通过
+# copy-on-write 共享。单进程 uvicorn 下该变量保持 None，不影响行为
+_preloaded_service: Optional[RAGChatService] = None
+_build_lock = threading.Lock()
+
+
+def build_service() -> Optional[RAGChatService]:
+    """构建 RAGChatService（含环境变量加载）
+
+    放在函数里而不是模块顶层，import api.main 不再触发
+    embedding 模型加载；在应用启动（lifespan）时执行，或由
+    gunicorn master 在 fork 前预先执行（此时结果被缓存复用）。
+
+    Returns:
+        初始化成功的服务实例，失败时返回 None
+    """
+    global _preloaded_service
+
+    with _build_lock:
+        if _preloaded_service is not None:
+            return _preloaded_service
+        service = _build_service_uncached()
+        _preloaded_service = service
+        return service
+
+
+def _build_service_uncached() -> Optional[RAGChatService]:
+    """实际构建服务实例（不走预加载缓存）"""
+    load_dotenv()
+
+    try:
+        llm_api_key = os.getenv("MOONSHOT_API_KEY")
+        if not llm_api_key:
+            raise ValueError("MOONSHOT_API_KEY not set in environment")
+
+        service = RAGChatService(
+            llm_provider="kimi",
+            llm_api_key=llm_api_key,
+            data_directory=os.getenv("DATA_DIRECTORY", "./data"),
+            history_dir=os.getenv("HISTORY_DIR", "./history"),
+        )
+        logger.info("✅ RAG 服务初始化成功")
+        return service
+    except Exception as e:
+        logger.error(f"❌ 服务初始化失败: {e}")
+        return None
+
+
+def _warmup(service: RAGChatService) -> None:
+    """后台预热检索链路（不调用 LLM，避免无意义的 API 消耗）"""
+    for query in _WARMUP_QUERIES:
+        try:
+            service.rag_client.search(query, limit=3)
+        except Exception as e:
+            logger.warning(f"预热查询失败: {e}")
+            return
+    logger.info("✅ 检索链路预热完成")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期：启动时构建服务并预热，关闭时回收线程池"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    # 模型加载放到线程，避免阻塞事件循环启动
+    app.state.service = await asyncio.to_thread(build_service)
+
+    if app.state.service is not None:
+        threading.Thread(
+            target=_warmup,
+            args=(app.state.service,),
+            name="rag-warmup",
+            daemon=True,
+        ).start()
+
+    yield
+
+    executor.shutdown(wait=True)
+
 
 # 创建 FastAPI 应用
 app = FastAPI(
     title="RAG 多轮对话 API",
     description="支持多轮对话记忆的 RAG 系统 API",
     version="1.0.0",
+    # orjson 直接产出 bytes，序列化比 stdlib json 快 3-5 倍
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # 添加 CORS 中间件
@@ -35,22 +138,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 初始化服务
-try:
-    llm_api_key = os.getenv("MOONSHOT_API_KEY")
-    if not llm_api_key:
-        raise ValueError("MOONSHOT_API_KEY not set in environment")
-
-    service = RAGChatService(
-        llm_provider="kimi",
-        llm_api_key=llm_api_key,
-        data_directory=os.getenv("DATA_DIRECTORY", "./data"),
-        history_dir=os.getenv("HISTORY_DIR", "./history"),
-    )
-    logger.info("✅ RAG 服务初始化成功")
-except Exception as e:
-    logger.error(f"❌ 服务初始化失败: {e}")
-    service = None
+
+def _get_service() -> Optional[RAGChatService]:
+    """获取 lifespan 中构建的服务实例"""
+    return getattr(app.state, "service", None)
 
 
 @app.get("/health")
@@ -59,20 +150,23 @@ async def health_check():
     return {
         "status": "ok",
         "service": "RAG Chat API",
-        "initialized": service is not None,
+        "initialized": _get_service() is not None,
     }
 
 
 @app.get("/stats")
 async def get_stats():
     """获取系统统计信息"""
+    service = _get_service()
     if not service:
         raise HTTPException(status_code=503, detail="Service not initialized")
 
-    return service.get_stats()
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, service.get_stats
+    )
 
 
-@app.post("/chat", response_model=ChatResponse)
+@app.post("/chat", response_model=ChatResponse, response_model_exclude_none=True)
 async def chat(request: ChatRequest) -> ChatResponse:
     """
     处理聊天请求
@@ -105,6 +199,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
     Returns:
         聊天响应
     """
+    service = _get_service()
     if not service:
         return ChatResponse(
             success=False,
@@ -114,12 +209,16 @@ async def chat(request: ChatRequest) -> ChatResponse:
     try:
         logger.info(f"[{request.platform}/{request.user_id}] 收到请求")
 
-        # 调用服务处理
-        reply = service.chat(
-            platform=request.platform,
-            user_id=request.user_id,
-            user_name=request.user_name,
-            message=request.message,
+        # 调用服务处理（在线程池中执行，避免阻塞事件循环）
+        reply = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(
+                service.chat,
+                platform=request.platform,
+                user_id=request.user_id,
+                user_name=request.user_name,
+                message=request.message,
+            ),
         )
 
         return ChatResponse(
@@ -135,14 +234,69 @@ async def chat(request: ChatRequest) -> ChatResponse:
         )
 
 
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """
+    流式聊天 - 以 Server-Sent Events 逐段返回回复
+
+    每个增量片段为一行 `data: {"delta": "..."}`，结束时发送
+    `data: [DONE]`。首 token 即开始返回，显著降低感知延迟。
+
+    Args:
+        request: 聊天请求（与 /chat 相同）
+
+    Returns:
+        text/event-stream 流式响应
+    """
+    service = _get_service()
+    if not service:
+        raise HTTPException(status_code=503, detail="Service not initialized")
+
+    logger.info(f"[{request.platform}/{request.user_id}] 收到流式请求")
+
+    def _next_chunk(gen, sentinel):
+        return next(gen, sentinel)
+
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        gen = service.chat_stream(
+            platform=request.platform,
+            user_id=request.user_id,
+            user_name=request.user_name,
+            message=request.message,
+        )
+        sentinel = object()
+        try:
+            while True:
+                # 阻塞的生成器在线程池中推进，不占用事件循环
+                chunk = await loop.run_in_executor(
+                    executor, _next_chunk, gen, sentinel
+                )
+                if chunk is sentinel:
+                    break
+                payload = json.dumps({"delta": chunk}, ensure_ascii=False)
+                yield f"data: {payload}\n\n"
+        except Exception as e:
+            logger.error(f"流式响应出错: {e}", exc_info=True)
+            payload = json.dumps({"error": str(e)}, ensure_ascii=False)
+            yield f"data: {payload}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.post("/clear-history")
 async def clear_history(platform: str, user_id: str):
     """清空用户的对话历史"""
+    service = _get_service()
     if not service:
         raise HTTPException(status_code=503, detail="Service not initialized")
 
     try:
-        service.clear_user_history(platform, user_id)
+        await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(service.clear_user_history, platform, user_id),
+        )
         return {
             "success": True,
             "message": f"已清空 {platform}/{user_id} 的对话历史",
@@ -1,7 +1,7 @@
 """API 请求和响应模型"""
 
 from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MessageHistory(BaseModel):
@@ -21,17 +21,21 @@ class ChatRequest(BaseModel):
         description="对话历史（可选）",
     )
 
-    class Config:
-        example = {
-            "platform": "bilibili",
-            "user_id": "123456",
-            "user_name": "阿良",
-            "message": "什么是向量数据库？",
-            "history": [
-                {"role": "user", "content": "你好"},
-                {"role": "assistant", "content": "你好！有什么我可以帮助的吗？"},
-            ],
+    # Pydantic v2 风格：schema 在模型构建时生成一次，避免 v1 兼容路径的重复构建
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "platform": "bilibili",
+                "user_id": "123456",
+                "user_name": "阿良",
+                "message": "什么是向量数据库？",
+                "history": [
+                    {"role": "user", "content": "你好"},
+                    {"role": "assistant", "content": "你好！有什么我可以帮助的吗？"},
+                ],
+            }
         }
+    )
 
 
 class ChatResponse(BaseModel):
@@ -40,8 +44,11 @@ class ChatResponse(BaseModel):
     reply: Optional[str] = Field(default=None, description="回复内容")
     error: Optional[str] = Field(default=None, description="错误信息")
 
-    class Config:
-        example = {
-            "success": True,
-            "reply": "向量数据库是存储和查询高维向量的数据库系统...",
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "success": True,
+                "reply": "向量数据库是存储和查询高维向量的数据库系统...",
+            }
         }
+    )
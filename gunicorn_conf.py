@@ -0,0 +1,36 @@
+"""Gunicorn 多进程部署配置
+
+单进程 uvicorn 下 CPU 密集的 embedding 编码会在同一个 GIL 上串行；
+多 worker 进程可以让各核并行编码。服务构建在 FastAPI lifespan 里，
+单靠 preload_app 只预加载模块，不会加载模型；因此 on_starting 钩子
+在 master 进程 fork 前显式构建一次服务（含 embedding 模型），worker
+的 lifespan 复用缓存实例，权重通过 copy-on-write 共享，省掉每个
+worker 一份的模型内存。
+
+用法:
+    gunicorn -c gunicorn_conf.py api.main:app
+
+注意: 如果 embedding 模型跑在 GPU 上（CUDA context 不可 fork 共享），
+请删除 on_starting 钩子并关闭 preload_app，让每个 worker 自行加载。
+"""
+
+import os
+
+bind = os.getenv("RAG_API_BIND", "127.0.0.1:8000")
+workers = int(os.getenv("RAG_API_WORKERS", str(max(1, os.cpu_count() or 1))))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# master 进程先加载应用模块，fork 共享
+preload_app = True
+
+
+def on_starting(server):
+    """master 进程 fork 前构建服务，模型权重经 copy-on-write 共享"""
+    from api import main
+
+    main.build_service()
+
+# 首次请求可能触发模型下载/预热，放宽超时
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
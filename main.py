@@ -5,6 +5,7 @@ RAG 交互式多轮对话系统 - main.py
 
 import logging
 import os
+import threading
 from dotenv import load_dotenv
 
 from src.services.rag_chat_service import RAGChatService
@@ -97,6 +98,17 @@ def main():
     print("系统会自动记忆对话历史")
     print("输入 'exit', 'quit' 或 'q' 退出\n")
 
+    # 后台预热：LLM 客户端是延迟创建的，趁用户输入第一个问题的时间
+    # 把它和检索链路热起来，首问不再付冷启动延迟
+    def _warmup():
+        try:
+            _ = service.llm
+            service.rag_client.search("你好", limit=1)
+        except Exception as e:
+            logger.debug(f"预热失败: {e}")
+
+    threading.Thread(target=_warmup, name="warmup", daemon=True).start()
+
     # 交互式对话循环
     platform = "terminal"
     user_id = "default"
@@ -114,17 +126,22 @@ def main():
                 print("\n👋 再见！")
                 break
 
-            # 处理对话
+            # 处理对话 - 流式输出，首 token 生成后立即打印
             print("\n🔍 思考中...\n")
-            reply = service.chat(
+
+            if args.debug:
+                service.debug_search(user_input)
+
+            print("助手: ", end="", flush=True)
+            for chunk in service.chat_stream(
                 platform=platform,
                 user_id=user_id,
                 user_name=user_name,
                 message=user_input,
-                debug=args.debug,
-            )
+            ):
+                print(chunk, end="", flush=True)
 
-            print(f"助手: {reply}\n")
+            print("\n")
             print("-" * 60 + "\n")
 
         except KeyboardInterrupt:
@@ -2,7 +2,7 @@
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -17,9 +17,20 @@ class FeishuConfig:
     app_secret: str
     wiki_space_id: Optional[str] = None
 
+    # from_env 的缓存实例：环境变量在进程生命周期内不变，
+    # 请求处理器里重复调用时直接复用，省去查询和校验
+    _cached: ClassVar[Optional["FeishuConfig"]] = None
+
     @classmethod
-    def from_env(cls) -> "FeishuConfig":
-        """Load Feishu config from environment variables"""
+    def from_env(cls, force_reload: bool = False) -> "FeishuConfig":
+        """Load Feishu config from environment variables
+
+        Args:
+            force_reload: 为 True 时重新读取环境变量并刷新缓存
+        """
+        if cls._cached is not None and not force_reload:
+            return cls._cached
+
         app_id = os.getenv("FEISHU_APP_ID")
         app_secret = os.getenv("FEISHU_APP_SECRET")
         wiki_space_id = os.getenv("FEISHU_WIKI_SPACE_ID")
@@ -29,11 +40,12 @@ class FeishuConfig:
                 "FEISHU_APP_ID and FEISHU_APP_SECRET must be set in .env file"
             )
 
-        return cls(
+        cls._cached = cls(
             app_id=app_id,
             app_secret=app_secret,
             wiki_space_id=wiki_space_id,
         )
+        return cls._cached
 
 
 @dataclass
@@ -44,13 +56,24 @@ class RAGConfig:
     vector_store: str = "chromadb"
     persist_directory: str = "./chroma_db"
 
+    # 同 FeishuConfig：from_env 结果在进程内复用
+    _cached: ClassVar[Optional["RAGConfig"]] = None
+
     @classmethod
-    def from_env(cls) -> "RAGConfig":
-        """Load RAG config from environment variables"""
-        return cls(
+    def from_env(cls, force_reload: bool = False) -> "RAGConfig":
+        """Load RAG config from environment variables
+
+        Args:
+            force_reload: 为 True 时重新读取环境变量并刷新缓存
+        """
+        if cls._cached is not None and not force_reload:
+            return cls._cached
+
+        cls._cached = cls(
             embedding_model=os.getenv(
                 "RAG_EMBEDDING_MODEL", "shibing624/text2vec-base-chinese"
             ),
             vector_store=os.getenv("RAG_VECTOR_STORE", "chromadb"),
             persist_directory=os.getenv("RAG_PERSIST_DIRECTORY", "./chroma_db"),
         )
+        return cls._cached
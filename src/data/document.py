@@ -1,11 +1,17 @@
 """Standard Document class for all data sources"""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+# slots 去掉每个实例约 200 B 的 __dict__ 开销，十万级批量加载时
+# 可省约 20 MB；slots=True 需要 Python 3.10+，3.9 下自动退回普通
+# dataclass 以保持兼容
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_KWARGS)
 class Document:
     """标准文档对象 - 所有数据源的统一格式"""
 
@@ -39,3 +45,30 @@ class Document:
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+    def to_wire_dict(self) -> dict:
+        """转换为传输/存储用字典（时间戳为毫秒整数）
+
+        批量入库时 isoformat() 的字符串格式化开销会在剖析中显现；
+        毫秒整数既省去格式化，也能直接存入向量库的元数据字段。
+        人类可读的导出仍用 to_dict()。
+
+        Returns:
+            字典，时间字段为 created_at_ms / updated_at_ms（毫秒时间戳）
+        """
+        return {
+            "doc_id": self.doc_id,
+            "source": self.source,
+            "title": self.title,
+            "url": self.url,
+            "content": self.content,
+            "metadata": self.metadata,
+            "created_at_ms": (
+                int(self.created_at.timestamp() * 1000)
+                if self.created_at else None
+            ),
+            "updated_at_ms": (
+                int(self.updated_at.timestamp() * 1000)
+                if self.updated_at else None
+            ),
+        }
@@ -0,0 +1,39 @@
+"""飞书加载器共享的 HTTP 会话构建
+
+模块级 ``requests.get/post`` 每次调用都新建适配器与 TCP/TLS 连接；
+分页循环里逐页付一次 TLS 握手的开销。这里统一构建带连接池与
+重试策略的 ``requests.Session``，keep-alive 让同主机请求复用连接。
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+#: 连接池大小；与异步路径的 MAX_CONNECTIONS 保持一致
+POOL_SIZE = 32
+
+
+def build_session() -> requests.Session:
+    """创建带连接池和重试的 Session
+
+    重试只针对瞬时错误（429 及 5xx），指数退避，幂等的 GET/POST
+    都覆盖（飞书这两类调用均可安全重试）。
+
+    Returns:
+        配置好的 requests.Session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "POST"),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
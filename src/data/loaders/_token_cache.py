@@ -0,0 +1,119 @@
+"""飞书访问令牌的共享缓存（进程内 + 磁盘）
+
+令牌真实有效期约 2 小时，但加载器把它缓存在实例属性上，
+每创建一个新实例（以及每次短脚本运行）都要重新走一次
+``/auth/v3/.../internal`` 的 HTTPS 往返。这里提供一个按
+``(app_id, 令牌类型)`` 键控的模块级缓存，并落盘到
+``~/.cache/feishu_token.json``，跨实例、跨进程复用同一令牌。
+
+磁盘文件通过 ``fcntl.flock`` 加锁，多进程并发读写安全。
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+    _HAS_FCNTL = True
+except ImportError:  # Windows
+    _HAS_FCNTL = False
+
+logger = logging.getLogger(__name__)
+
+# 进程内缓存：{(app_id, kind): (token, expiry)}
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, datetime]] = {}
+_LOCK = threading.Lock()
+
+_CACHE_FILE = Path(
+    os.getenv("FEISHU_TOKEN_CACHE", "~/.cache/feishu_token.json")
+).expanduser()
+
+
+def _read_disk_cache() -> Dict[str, Dict[str, str]]:
+    """读取磁盘缓存文件（加共享锁），失败时返回空字典"""
+    try:
+        with open(_CACHE_FILE, "r", encoding="utf-8") as f:
+            if _HAS_FCNTL:
+                fcntl.flock(f, fcntl.LOCK_SH)
+            try:
+                return json.load(f)
+            finally:
+                if _HAS_FCNTL:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_cached_token(app_id: str, kind: str) -> Optional[Tuple[str, datetime]]:
+    """查询缓存的令牌
+
+    先查进程内字典，未命中再查磁盘文件。
+
+    Args:
+        app_id: 飞书应用 ID
+        kind: 令牌类型（"tenant" 或 "app"，两者不可互换）
+
+    Returns:
+        (token, expiry) 元组；无有效缓存时返回 None
+    """
+    now = datetime.now()
+
+    with _LOCK:
+        cached = _TOKEN_CACHE.get((app_id, kind))
+        if cached and now < cached[1]:
+            return cached
+
+    entry = _read_disk_cache().get(f"{app_id}:{kind}")
+    if not entry:
+        return None
+
+    try:
+        expiry = datetime.fromisoformat(entry["expiry"])
+        token = entry["token"]
+    except (KeyError, ValueError):
+        return None
+
+    if now >= expiry:
+        return None
+
+    with _LOCK:
+        _TOKEN_CACHE[(app_id, kind)] = (token, expiry)
+    logger.debug("Feishu token for %s reused from disk cache", app_id)
+    return token, expiry
+
+
+def store_token(app_id: str, kind: str, token: str, expiry: datetime) -> None:
+    """写入新刷新的令牌（同时更新内存与磁盘）"""
+    with _LOCK:
+        _TOKEN_CACHE[(app_id, kind)] = (token, expiry)
+
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # 读-改-写整个文件，期间持有排他锁
+        with open(_CACHE_FILE, "a+", encoding="utf-8") as f:
+            if _HAS_FCNTL:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    data = json.load(f)
+                except ValueError:
+                    data = {}
+                data[f"{app_id}:{kind}"] = {
+                    "token": token,
+                    "expiry": expiry.isoformat(),
+                }
+                f.seek(0)
+                f.truncate()
+                json.dump(data, f)
+            finally:
+                if _HAS_FCNTL:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+    except OSError as e:
+        # 磁盘缓存只是优化，写失败不影响正常流程
+        logger.debug("Failed to persist Feishu token cache: %s", e)
@@ -1,13 +1,17 @@
 """Feishu document loader with Wiki space traversal"""
 
 import requests
+from collections import deque
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
+import threading
 
 from ..document import Document
 from ..config import FeishuConfig
 from .base import BaseDataLoader
+from . import _token_cache
+from ._http import build_session
 
 logger = logging.getLogger(__name__)
 
@@ -50,15 +54,37 @@ class FeishuLoader(BaseDataLoader):
 
         self.access_token = None
         self.token_expiry = None
+        # 带连接池与重试的会话：遍历/分页复用同一条 keep-alive 连接
+        self._session = build_session()
+        self._token_lock = threading.Lock()
 
     def get_access_token(self) -> str:
-        """获取/刷新访问令牌"""
+        """获取/刷新访问令牌
+
+        双重检查锁：无锁快路径命中缓存直接返回；过期后多个并发调用
+        只有一个真正打认证接口，其余在锁上等它写回结果。
+        """
         # 检查缓存的 token 是否还有效
         if self.access_token and self.token_expiry and datetime.now() < self.token_expiry:
             return self.access_token
 
+        with self._token_lock:
+            # 拿到锁后重查：可能别的线程刚刷新过
+            if self.access_token and self.token_expiry and datetime.now() < self.token_expiry:
+                return self.access_token
+
+            # 再查跨实例/跨进程共享缓存，避免每个新实例都打一次认证接口
+            cached = _token_cache.get_cached_token(self.config.app_id, "app")
+            if cached:
+                self.access_token, self.token_expiry = cached
+                return self.access_token
+
+            return self._fetch_access_token()
+
+    def _fetch_access_token(self) -> str:
+        """真正请求认证接口刷新令牌（调用方须持有 _token_lock）"""
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.FEISHU_API_BASE}/auth/v3/app_access_token/internal",
                 json={"app_id": self.config.app_id, "app_secret": self.config.app_secret},
                 timeout=10,
@@ -71,6 +97,9 @@ class FeishuLoader(BaseDataLoader):
             self.access_token = data["app_access_token"]
             expire_in = data.get("expire", 7200)
             self.token_expiry = datetime.now() + timedelta(seconds=expire_in - 300)
+            _token_cache.store_token(
+                self.config.app_id, "app", self.access_token, self.token_expiry
+            )
 
             logger.info("✅ Feishu access token obtained successfully")
             return self.access_token
@@ -79,81 +108,113 @@ class FeishuLoader(BaseDataLoader):
             logger.error(f"❌ Failed to authenticate with Feishu: {e}")
             raise
 
-    def get_wiki_nodes(self, space_id: str) -> List[Dict[str, Any]]:
-        """获取Wiki空间中的所有节点（文件夹和文档）"""
-        token = self.get_access_token()
-        nodes = []
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """执行一次带鉴权的飞书 API 调用
+
+        统一注入 Authorization 头、解析 JSON、检查业务 code；
+        传输层的重试/退避由 session 适配器（见 _http）负责。
+        把这些样板收敛到一处后，限流处理等策略只需改这里。
+
+        Args:
+            method: HTTP 方法
+            path: API 路径（FEISHU_API_BASE 之后的部分）
+            params: 查询参数
+            json: 请求体
 
+        Returns:
+            响应的 data 字段；失败时返回 None
+        """
         try:
-            response = requests.get(
-                f"{self.FEISHU_API_BASE}/wiki/v2/spaces/{space_id}/nodes",
-                headers={"Authorization": f"Bearer {token}"},
+            response = self._session.request(
+                method,
+                f"{self.FEISHU_API_BASE}{path}",
+                headers={"Authorization": f"Bearer {self.get_access_token()}"},
+                params=params,
+                json=json,
                 timeout=10,
             )
             data = response.json()
+        except Exception as e:
+            logger.error(f"Feishu request failed {path}: {e}")
+            return None
 
-            if data.get("code") != 0:
-                logger.warning(f"Failed to get wiki nodes: {data.get('msg')}")
-                return []
+        if data.get("code") != 0:
+            logger.warning(f"Feishu API error {path}: {data.get('msg')}")
+            return None
 
-            nodes = data.get("data", {}).get("items", [])
-            logger.info(f"Found {len(nodes)} nodes in wiki space")
-            return nodes
+        return data.get("data", {})
 
-        except Exception as e:
-            logger.error(f"Failed to get wiki nodes: {e}")
-            return []
+    def _list_children(
+        self, space_id: str, parent_node_token: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """列出某节点的直接子节点（自动翻页）
 
-    def get_document_content(self, doc_id: str) -> str:
-        """获取飞书文档的 markdown 内容"""
-        token = self.get_access_token()
+        Args:
+            space_id: Wiki 空间 ID
+            parent_node_token: 父节点 token；None 表示空间根节点
 
-        try:
-            response = requests.get(
-                f"{self.FEISHU_API_BASE}/docs/v2/{doc_id}/raw_content",
-                headers={"Authorization": f"Bearer {token}"},
-                timeout=10,
+        Returns:
+            子节点列表（大空间会跨多页，这里合并所有页）
+        """
+        nodes: List[Dict[str, Any]] = []
+        page_token = None
+
+        while True:
+            params: Dict[str, Any] = {}
+            if parent_node_token:
+                params["parent_node_token"] = parent_node_token
+            if page_token:
+                params["page_token"] = page_token
+
+            payload = self._request(
+                "GET", f"/wiki/v2/spaces/{space_id}/nodes", params=params
             )
-            data = response.json()
-
-            if data.get("code") != 0:
-                logger.warning(f"Failed to get document {doc_id}: {data.get('msg')}")
-                return ""
+            if payload is None:
+                break
 
-            return data.get("data", {}).get("content", "")
-
-        except Exception as e:
-            logger.error(f"Failed to get document content {doc_id}: {e}")
-            return ""
+            nodes.extend(payload.get("items", []))
 
-    def get_document_metadata(self, doc_id: str) -> Dict[str, Any]:
-        """获取文档元数据"""
-        token = self.get_access_token()
+            if not payload.get("has_more"):
+                break
+            page_token = payload.get("page_token")
 
-        try:
-            response = requests.get(
-                f"{self.FEISHU_API_BASE}/docs/v2/{doc_id}",
-                headers={"Authorization": f"Bearer {token}"},
-                timeout=10,
-            )
-            data = response.json()
+        return nodes
 
-            if data.get("code") != 0:
-                logger.warning(f"Failed to get metadata for {doc_id}")
-                return {}
+    def get_wiki_nodes(self, space_id: str) -> List[Dict[str, Any]]:
+        """获取Wiki空间根节点下的所有节点（文件夹和文档）"""
+        nodes = self._list_children(space_id)
+        logger.info(f"Found {len(nodes)} nodes in wiki space")
+        return nodes
 
-            return data.get("data", {})
+    def get_document_content(self, doc_id: str) -> str:
+        """获取飞书文档的 markdown 内容"""
+        data = self._request("GET", f"/docs/v2/{doc_id}/raw_content")
+        return (data or {}).get("content", "")
 
-        except Exception as e:
-            logger.error(f"Failed to get document metadata {doc_id}: {e}")
-            return {}
+    def get_document_metadata(self, doc_id: str) -> Dict[str, Any]:
+        """获取文档元数据"""
+        return self._request("GET", f"/docs/v2/{doc_id}") or {}
 
     def traverse_wiki(self, space_id: str) -> List[Document]:
-        """递归遍历Wiki空间，获取所有文档"""
+        """遍历Wiki空间，获取所有文档
+
+        用 deque 工作队列迭代展开节点树。此前文件夹分支递归调用的是
+        traverse_wiki(space_id) 本身——每层都重新抓取空间根节点，既产生
+        指数级重复请求又会在深树上触发递归上限；迭代版本对每个节点只
+        访问一次，整体开销是 O(节点数)。
+        """
         documents = []
-        nodes = self.get_wiki_nodes(space_id)
+        worklist = deque(self._list_children(space_id))
 
-        for node in nodes:
+        while worklist:
+            node = worklist.popleft()
             try:
                 node_type = node.get("type")
                 node_id = node.get("node_token")
@@ -168,7 +229,17 @@ class FeishuLoader(BaseDataLoader):
                         logger.warning(f"Empty content for document {title}")
                         continue
 
-                    meta = self.get_document_metadata(node_id)
+                    # 节点列表本身已带 owner/创建/编辑时间，直接复用，
+                    # 省掉每个文档一次元数据请求；个别空间缺字段时
+                    # 才退回单独调用
+                    owner = node.get("owner_id", "")
+                    created_at = node.get("obj_create_time")
+                    updated_at = node.get("obj_edit_time")
+                    if not (owner and created_at and updated_at):
+                        meta = self.get_document_metadata(node_id)
+                        owner = owner or meta.get("owner_id", "")
+                        created_at = created_at or meta.get("create_time")
+                        updated_at = updated_at or meta.get("update_time")
 
                     doc = Document(
                         content=content,
@@ -177,9 +248,9 @@ class FeishuLoader(BaseDataLoader):
                         title=title,
                         url=f"https://feishu.cn/docs/{node_id}",
                         metadata={
-                            "owner": meta.get("owner_id", ""),
-                            "created_at": meta.get("create_time"),
-                            "updated_at": meta.get("update_time"),
+                            "owner": owner,
+                            "created_at": created_at,
+                            "updated_at": updated_at,
                             "wiki_space_id": space_id,
                             "node_type": "document",
                         },
@@ -190,10 +261,9 @@ class FeishuLoader(BaseDataLoader):
                     logger.info(f"✅ Loaded document: {title}")
 
                 elif node_type == "folder":
-                    # 这是一个文件夹，递归进去
+                    # 这是一个文件夹，展开它的子节点继续处理
                     logger.info(f"Traversing folder: {title}")
-                    sub_docs = self.traverse_wiki(space_id)
-                    documents.extend(sub_docs)
+                    worklist.extend(self._list_children(space_id, node_id))
 
             except Exception as e:
                 logger.error(f"Error processing node {node.get('title')}: {e}")
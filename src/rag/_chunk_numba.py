@@ -0,0 +1,82 @@
+"""Numba-compiled chunking kernels for DocumentLoader
+
+Importing this module requires numba; DocumentLoader guards the import
+and falls back to the pure-Python chunkers when numba is unavailable.
+"""
+
+import numpy as np
+from numba import njit
+
+
+def warmup() -> None:
+    """Compile (or load the cached binary of) the kernels ahead of use
+
+    With cache=True the compiled machine code is persisted next to the
+    source, so this costs a full JIT only once per machine; afterwards
+    it is a quick disk load. DocumentLoader calls this from a
+    background thread at import so the first large document does not
+    pay the compilation latency on the request path.
+    """
+    smart_chunk_offsets(
+        np.zeros(1, np.uint32), 1, np.zeros(1, np.uint32)
+    )
+
+
+@njit(cache=True)
+def smart_chunk_offsets(
+    codepoints: np.ndarray,
+    chunk_size: int,
+    sentence_enders: np.ndarray,
+) -> np.ndarray:
+    """Compute chunk boundaries over a codepoint array
+
+    Walks the text once, cutting at the last sentence-ending codepoint
+    before each chunk_size window. Chunks are guaranteed to be at least
+    chunk_size // 4 codepoints long so the output is bounded.
+
+    Args:
+        codepoints: uint32 array of the text's codepoints
+        chunk_size: Target chunk size in codepoints
+        sentence_enders: uint32 array of sentence-ending codepoints
+
+    Returns:
+        (N, 2) int64 array of (start, end) offsets into the text
+    """
+    n = codepoints.shape[0]
+    min_chunk = max(chunk_size // 4, 1)
+    max_chunks = n // min_chunk + 2
+    out = np.empty((max_chunks, 2), np.int64)
+
+    count = 0
+    start = 0
+    last_ender = -1
+    i = 0
+
+    while i < n:
+        c = codepoints[i]
+        for j in range(sentence_enders.shape[0]):
+            if c == sentence_enders[j]:
+                last_ender = i
+                break
+
+        if i - start + 1 >= chunk_size:
+            if last_ender >= start + min_chunk:
+                end = last_ender + 1
+            else:
+                end = i + 1
+            out[count, 0] = start
+            out[count, 1] = end
+            count += 1
+            start = end
+            last_ender = -1
+            i = end
+            continue
+
+        i += 1
+
+    if start < n:
+        out[count, 0] = start
+        out[count, 1] = n
+        count += 1
+
+    return out[:count]
@@ -0,0 +1,78 @@
+"""Content-addressed on-disk cache for DocumentLoader chunk lists"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import List, Union
+
+from .document_loader import DocumentLoader
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "./.chunkcache"
+
+
+def load_file_cached(
+    loader: DocumentLoader,
+    file_path: Union[str, Path],
+    strategy: str = "smart",
+    chunk_size: int = 300,
+    overlap: int = 50,
+    cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+) -> List[str]:
+    """Load and chunk a file, reusing chunks cached on disk
+
+    The cache key is a hash of the file bytes plus the chunking
+    parameters, so edits to the file or different strategies miss
+    naturally and stale entries are simply never referenced again.
+    Unlike DocumentLoader's in-memory cache this survives across
+    processes, which makes repeated demo/benchmark runs essentially
+    free after the first.
+
+    Args:
+        loader: DocumentLoader instance used on cache miss
+        file_path: Path to the text file
+        strategy: Chunking strategy passed to load_file
+        chunk_size: Target chunk size passed to load_file
+        overlap: Overlap passed to load_file (fixed_size strategy)
+        cache_dir: Directory holding cached chunk lists
+
+    Returns:
+        List of text chunks
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = Path(file_path)
+    if not path.is_file():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    key = hashlib.sha256(
+        path.read_bytes() + f"{strategy}:{chunk_size}:{overlap}".encode("utf-8")
+    ).hexdigest()
+
+    cache_dir = Path(cache_dir)
+    cache_file = cache_dir / f"{key}.json"
+
+    if cache_file.is_file():
+        try:
+            chunks = json.loads(cache_file.read_text(encoding="utf-8"))
+            logger.debug("Chunk cache hit for %s (%d chunks)", path.name, len(chunks))
+            return chunks
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Ignoring corrupt chunk cache entry %s: %s", cache_file, e)
+
+    chunks = loader.load_file(
+        path, strategy=strategy, chunk_size=chunk_size, overlap=overlap
+    )
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps(chunks, ensure_ascii=False), encoding="utf-8"
+        )
+    except OSError as e:
+        logger.warning("Failed to write chunk cache entry: %s", e)
+
+    return chunks
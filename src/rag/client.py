@@ -1,6 +1,11 @@
 """RAG Client with dependency injection and flexible architecture"""
 
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
+
+import numpy as np
 from .core.embedding import BaseEmbedding
 from .core.vector_store import BaseVectorStore
 from .embeddings.factory import create_embedding
@@ -8,6 +13,7 @@ from .stores.factory import create_vector_store
 from .config import RAGConfig, EmbeddingConfig, VectorStoreConfig
 from .types import SearchResult
 from .reranker import Reranker
+from .embedding_cache import EmbeddingCache
 
 
 class RAGClient:
@@ -71,10 +77,23 @@ class RAGClient:
         else:
             self.enable_reranking = config.enable_reranking
 
-        if self.enable_reranking:
-            self.reranker = Reranker()
+        # Reranker is created lazily on first access (see reranker property)
+        self._reranker: Optional[Reranker] = None
+
+        # Optional content-addressed embedding cache (see RAGConfig)
+        if config.cache_embeddings or config.embedding_cache_path:
+            self._embedding_cache = EmbeddingCache(
+                cache_path=config.embedding_cache_path
+            )
         else:
-            self.reranker = None
+            self._embedding_cache = None
+
+        # Query-embedding LRU: repeated queries skip the encode forward
+        # pass, the dominant CPU cost of a search (see RAGConfig).
+        # Searches arrive from multi-threaded callers (the API executor),
+        # so read-modify-write on the OrderedDict is guarded by a lock
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
 
     @classmethod
     def from_config(cls, config: RAGConfig) -> "RAGClient":
@@ -109,14 +128,52 @@ class RAGClient:
         Raises:
             ValueError: If provider is unsupported
         """
-        if config.provider in ("text2vec", "gte"):
-            return create_embedding(provider=config.provider, model_name=config.model_name)
+        if config.provider in ("text2vec", "gte", "model2vec", "tei"):
+            return create_embedding(
+                provider=config.provider,
+                model_name=config.model_name,
+                dtype=config.dtype,
+                cache_size=config.cache_size,
+                cache_path=config.cache_path,
+            )
         # Future: Add support for OpenAI, Cohere, etc.
         # elif config.provider == "openai":
         #     return OpenAIEmbedding(api_key=config.api_key, model=config.model_name)
         else:
             raise ValueError(f"Unsupported embedding provider: {config.provider}")
 
+    def _encode_query(self, query: str) -> List[float]:
+        """Encode a query, reusing cached embeddings for repeated queries
+
+        The cache is keyed by the stripped query text and bounded by
+        RAGConfig.query_cache_size with LRU eviction; size 0 disables it.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Query embedding vector
+        """
+        cache_size = self.config.query_cache_size
+        if cache_size <= 0:
+            return self.embedding.encode(query)
+
+        key = query.strip()
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                return cached
+
+        # Encode outside the lock: two threads racing on the same new
+        # query just compute the same vector twice, which is harmless
+        embedding = self.embedding.encode(query)
+        with self._query_cache_lock:
+            self._query_cache[key] = embedding
+            while len(self._query_cache) > cache_size:
+                self._query_cache.popitem(last=False)
+        return embedding
+
     def add_document(
         self,
         content: str,
@@ -139,11 +196,14 @@ class RAGClient:
         if not content or not content.strip():
             raise ValueError("Document content cannot be empty")
 
-        # Generate embedding using injected embedding model
-        embedding = self.embedding.encode(content)
-        if not isinstance(embedding[0], list):
-            # Single embedding, wrap in list
-            embedding = [embedding]
+        # Generate embedding using injected embedding model. Shape
+        # normalization goes through NumPy: encoders variously return a
+        # flat vector, a singleton list-of-lists or an ndarray, and the
+        # old `isinstance(embedding[0], list)` check double-wrapped the
+        # list-of-lists case into invalid 3-D input.
+        embedding = np.asarray(self.embedding.encode(content), dtype=np.float32)
+        if embedding.ndim == 1:
+            embedding = embedding[None, :]
 
         # Add to vector store
         ids = self.vector_store.add_documents(
@@ -159,7 +219,8 @@ class RAGClient:
         self,
         documents: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
-        doc_ids: Optional[List[str]] = None
+        doc_ids: Optional[List[str]] = None,
+        upsert: bool = False,
     ) -> List[str]:
         """Add multiple documents
 
@@ -167,6 +228,8 @@ class RAGClient:
             documents: List of document contents
             metadatas: Optional list of metadata dicts
             doc_ids: Optional list of document IDs
+            upsert: Overwrite existing IDs instead of raising, using the
+                store's single-transaction upsert when available
 
         Returns:
             List of document IDs
@@ -174,14 +237,91 @@ class RAGClient:
         if not documents:
             return []
 
-        # Generate embeddings using injected embedding model
-        embeddings = self.embedding.encode(documents)
+        batch_size = self.config.embedding.batch_size
+        workers = self.config.ingest_workers
+
+        # Opt-in parallel ingestion: shard into batches and encode+store
+        # concurrently. Only worthwhile when the embedding backend
+        # releases the GIL (see RAGConfig.ingest_workers).
+        if workers > 1 and len(documents) > batch_size * 2:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        self._encode_and_store,
+                        documents[start:start + batch_size],
+                        metadatas[start:start + batch_size] if metadatas else None,
+                        doc_ids[start:start + batch_size] if doc_ids else None,
+                        upsert,
+                    )
+                    for start in range(0, len(documents), batch_size)
+                ]
+                ids: List[str] = []
+                for future in futures:
+                    ids.extend(future.result())
+            return ids
+
+        return self._encode_and_store(documents, metadatas, doc_ids, upsert)
+
+    def _encode_and_store(
+        self,
+        documents: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        doc_ids: Optional[List[str]] = None,
+        upsert: bool = False,
+    ) -> List[str]:
+        """Encode one batch of documents and add it to the vector store
 
-        # Ensure embeddings is a list of lists
-        if embeddings and not isinstance(embeddings[0], list):
-            embeddings = [embeddings]
+        Args:
+            documents: Document contents for this batch
+            metadatas: Optional metadata dicts for this batch
+            doc_ids: Optional document IDs for this batch
+            upsert: Use the store's upsert path when supported
+
+        Returns:
+            List of document IDs
+        """
+        # Generate embeddings in batches so all chunks of a single call
+        # go through the model together (amortizes tokenizer/dispatch cost).
+        # With the cache enabled, only unseen (text, model) pairs are encoded.
+        if self._embedding_cache is not None:
+            # The cache deduplicates by content hash internally
+            embeddings = self._embedding_cache.get_or_compute_many(
+                texts=documents,
+                model_name=self.embedding.model_name,
+                compute_batch=lambda texts: self.embedding.encode_batch(
+                    texts,
+                    batch_size=self.config.embedding.batch_size,
+                ),
+            )
+        else:
+            # Encode each distinct text once; duplicated chunks (shared
+            # boilerplate, repeated filler documents) reuse the vector
+            unique_texts = list(dict.fromkeys(documents))
+            vectors = np.asarray(
+                self.embedding.encode_batch(
+                    unique_texts,
+                    batch_size=self.config.embedding.batch_size,
+                ),
+                dtype=np.float32,
+            )
+            if vectors.ndim == 1:
+                vectors = vectors[None, :]
+
+            # One contiguous (N, d) float32 block instead of a list of
+            # boxed-float lists (~14x the heap for the same vectors);
+            # fancy indexing expands the dedup mapping in one copy
+            row_by_text = {text: i for i, text in enumerate(unique_texts)}
+            embeddings = vectors[[row_by_text[doc] for doc in documents]]
+
+        # Add to vector store (upsert when requested and supported)
+        if upsert and hasattr(self.vector_store, "bulk_upsert"):
+            return self.vector_store.bulk_upsert(
+                documents=documents,
+                embeddings=embeddings,
+                metadatas=metadatas,
+                ids=doc_ids
+            )
 
-        # Add to vector store
         return self.vector_store.add_documents(
             documents=documents,
             embeddings=embeddings,
@@ -195,6 +335,7 @@ class RAGClient:
         limit: Optional[int] = None,
         score_threshold: Optional[float] = None,
         filter_metadata: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[SearchResult]:
         """Search for similar documents
 
@@ -203,6 +344,8 @@ class RAGClient:
             limit: Maximum number of results (uses config default if None)
             score_threshold: Optional minimum similarity score
             filter_metadata: Optional metadata filter
+            query_embedding: Optional pre-computed query embedding
+                (skips the embedding forward pass, e.g. for cached queries)
 
         Returns:
             List of search results
@@ -219,8 +362,9 @@ class RAGClient:
         if score_threshold is None:
             score_threshold = self.config.default_score_threshold
 
-        # Generate query embedding
-        query_embedding = self.embedding.encode(query)
+        # Generate query embedding (unless a pre-computed one was injected)
+        if query_embedding is None:
+            query_embedding = self._encode_query(query)
 
         # Search vector store
         results = self.vector_store.search(
@@ -240,6 +384,108 @@ class RAGClient:
 
         return results[:limit]
 
+    def search_with_vec(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> tuple:
+        """Search and also return the query embedding
+
+        Useful when a downstream component (debug similarity scores,
+        custom scoring) needs the query vector: it is computed once here
+        instead of a second encode of the same string.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results (uses config default if None)
+            score_threshold: Optional minimum similarity score
+            filter_metadata: Optional metadata filter
+
+        Returns:
+            Tuple of (search results, query embedding vector)
+
+        Raises:
+            ValueError: If query is empty
+        """
+        if not query or not query.strip():
+            raise ValueError("Query cannot be empty")
+
+        query_embedding = self._encode_query(query)
+        results = self.search(
+            query,
+            limit=limit,
+            score_threshold=score_threshold,
+            filter_metadata=filter_metadata,
+            query_embedding=query_embedding,
+        )
+        return results, query_embedding
+
+    def search_batch(
+        self,
+        queries: List[str],
+        limit: Optional[int] = None,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[List[SearchResult]]:
+        """Search for similar documents for several queries at once
+
+        All queries go through the embedding model in a single batched
+        forward pass, amortizing tokenizer and dispatch overhead that a
+        per-query search() loop pays N times.
+
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query (config default if None)
+            score_threshold: Optional minimum similarity score
+            filter_metadata: Optional metadata filter
+
+        Returns:
+            One result list per query, in query order
+
+        Raises:
+            ValueError: If any query is empty
+        """
+        if not queries:
+            return []
+
+        for query in queries:
+            if not query or not query.strip():
+                raise ValueError("Query cannot be empty")
+
+        if limit is None:
+            limit = self.config.default_search_limit
+        if score_threshold is None:
+            score_threshold = self.config.default_score_threshold
+
+        # One batched forward pass for all queries; stacked into a
+        # (Q, d) matrix so matrix-backed stores consume it directly
+        query_embeddings = np.asarray(
+            self.embedding.encode_batch(queries), dtype=np.float32
+        )
+        if query_embeddings.ndim == 1:
+            query_embeddings = query_embeddings[None, :]
+
+        fetch_limit = limit * 2 if self.enable_reranking else limit
+        # Matrix-backed stores score all queries in one GEMM; the
+        # base-class default falls back to one search per query
+        results_lists = self.vector_store.search_batch(
+            query_embeddings=query_embeddings,
+            limit=fetch_limit,
+            score_threshold=score_threshold,
+            filter_metadata=filter_metadata,
+        )
+
+        if self.enable_reranking and self.reranker:
+            results_lists = self.reranker.rerank_batch(
+                queries=queries,
+                results_lists=results_lists,
+                top_k=limit,
+            )
+
+        return [results[:limit] for results in results_lists]
+
     def delete_documents(self, ids: List[str]) -> None:
         """Delete documents by IDs
 
@@ -270,6 +516,17 @@ class RAGClient:
             **collection_info,
         }
 
+    @property
+    def reranker(self) -> Optional[Reranker]:
+        """Reranker instance, or None when reranking is disabled
+
+        Constructed lazily on first access so retrieval-only workloads
+        never pay for it.
+        """
+        if self.enable_reranking and self._reranker is None:
+            self._reranker = Reranker()
+        return self._reranker
+
     @property
     def collection_name(self) -> str:
         """Get collection name"""
@@ -8,10 +8,24 @@ from typing import Literal, Optional
 class EmbeddingConfig:
     """Configuration for embedding models"""
 
-    provider: Literal["text2vec", "gte", "openai", "custom"] = "text2vec"
+    provider: Literal["text2vec", "gte", "model2vec", "tei", "openai", "custom"] = "text2vec"
     model_name: str = "shibing624/text2vec-base-chinese"
     batch_size: int = 32
 
+    # Weight precision for torch-backed models ("float32", "float16",
+    # "bfloat16"). Half precision halves encoding memory bandwidth;
+    # None keeps the model's default float32.
+    dtype: Optional[Literal["float32", "float16", "bfloat16"]] = None
+
+    # Encoder-level LRU cache: repeated texts skip the forward pass.
+    # Bounded to this many vectors; 0 disables caching.
+    cache_size: int = 0
+
+    # SQLite file persisting encoder vectors (float16 blobs) across
+    # process restarts; re-ingesting an unchanged corpus skips the
+    # forward passes. None disables persistence.
+    cache_path: Optional[str] = None
+
     # For OpenAI (future extension)
     api_key: Optional[str] = None
     api_base: Optional[str] = None
@@ -21,11 +35,34 @@ class EmbeddingConfig:
 class VectorStoreConfig:
     """Configuration for vector stores"""
 
-    provider: Literal["chromadb", "qdrant", "custom"] = "chromadb"
+    provider: Literal["chromadb", "memory", "faiss", "qdrant", "custom"] = "chromadb"
     persist_directory: str = "./chroma_db"
     collection_name: str = "documents"
     allow_reset: bool = True
 
+    # HNSW index parameters for the "chromadb" provider. Defaults trade
+    # some build time for recall on collections beyond ~10k vectors;
+    # they only apply when the collection is first created.
+    hnsw_m: int = 24
+    hnsw_ef_construction: int = 128
+    hnsw_ef_search: int = 100
+
+    # Storage quantization for the "memory" provider: "int8" stores
+    # vectors as int8 codes with per-row scales (4x less memory traffic,
+    # integer dot products), "float16" halves memory with no scale
+    # bookkeeping. ChromaDB keeps its own float32 index.
+    quantization: Optional[Literal["int8", "float16"]] = None
+
+    # Write-behind commit batching for the "chromadb" provider: buffer
+    # this many documents before committing them in one call (one
+    # SQLite transaction per batch instead of per add). Reads flush
+    # transparently; 0 disables buffering.
+    commit_batch_size: int = 0
+
+    # For the "faiss" provider: FAISS indexes are built for a fixed
+    # embedding dimension, so it must be declared up front.
+    dimension: Optional[int] = None
+
     # For Qdrant (future extension)
     url: Optional[str] = None
     api_key: Optional[str] = None
@@ -46,6 +83,20 @@ class RAGConfig:
     enable_reranking: bool = False
     rerank_top_k: int = 5
 
+    # Ingestion: number of threads encoding document batches in parallel.
+    # Only helps when the embedding backend releases the GIL (ONNX, TEI
+    # sidecar, etc.); keep at 1 for in-process PyTorch models.
+    ingest_workers: int = 1
+
+    # Content-addressed embedding cache: skip re-embedding chunks whose
+    # (text, model) pair was already seen. Set a path to persist across runs.
+    cache_embeddings: bool = False
+    embedding_cache_path: Optional[str] = None
+
+    # Query-embedding LRU: repeated queries (common in chatbots) skip
+    # the encode forward pass entirely. 0 disables the cache.
+    query_cache_size: int = 1024
+
     @classmethod
     def default_chinese(cls) -> "RAGConfig":
         """Create default configuration optimized for Chinese text
@@ -66,6 +117,29 @@ class RAGConfig:
             enable_reranking=True
         )
 
+    @classmethod
+    def default_chinese_fast(cls) -> "RAGConfig":
+        """Create configuration favoring ingestion speed over accuracy
+
+        Uses a Model2Vec static embedding (token lookup + mean pooling)
+        instead of a transformer forward pass — roughly 10x faster for
+        batch indexing. Requires the optional `model2vec` package.
+
+        Returns:
+            RAGConfig with fast static-embedding settings
+        """
+        return cls(
+            embedding=EmbeddingConfig(
+                provider="model2vec",
+                model_name="minishlab/potion-base-8M"
+            ),
+            vector_store=VectorStoreConfig(
+                provider="chromadb",
+                persist_directory="./chroma_db",
+                collection_name="documents"
+            ),
+        )
+
     @classmethod
     def from_dict(cls, config_dict: dict) -> "RAGConfig":
         """Create configuration from dictionary
@@ -86,6 +160,10 @@ class RAGConfig:
             default_score_threshold=config_dict.get("default_score_threshold"),
             enable_reranking=config_dict.get("enable_reranking", False),
             rerank_top_k=config_dict.get("rerank_top_k", 5),
+            ingest_workers=config_dict.get("ingest_workers", 1),
+            cache_embeddings=config_dict.get("cache_embeddings", False),
+            embedding_cache_path=config_dict.get("embedding_cache_path"),
+            query_cache_size=config_dict.get("query_cache_size", 1024),
         )
 
     def to_dict(self) -> dict:
@@ -99,15 +177,28 @@ class RAGConfig:
                 "provider": self.embedding.provider,
                 "model_name": self.embedding.model_name,
                 "batch_size": self.embedding.batch_size,
+                "dtype": self.embedding.dtype,
+                "cache_size": self.embedding.cache_size,
+                "cache_path": self.embedding.cache_path,
             },
             "vector_store": {
                 "provider": self.vector_store.provider,
                 "persist_directory": self.vector_store.persist_directory,
                 "collection_name": self.vector_store.collection_name,
                 "allow_reset": self.vector_store.allow_reset,
+                "hnsw_m": self.vector_store.hnsw_m,
+                "hnsw_ef_construction": self.vector_store.hnsw_ef_construction,
+                "hnsw_ef_search": self.vector_store.hnsw_ef_search,
+                "quantization": self.vector_store.quantization,
+                "commit_batch_size": self.vector_store.commit_batch_size,
+                "dimension": self.vector_store.dimension,
             },
             "default_search_limit": self.default_search_limit,
             "default_score_threshold": self.default_score_threshold,
             "enable_reranking": self.enable_reranking,
             "rerank_top_k": self.rerank_top_k,
+            "ingest_workers": self.ingest_workers,
+            "cache_embeddings": self.cache_embeddings,
+            "embedding_cache_path": self.embedding_cache_path,
+            "query_cache_size": self.query_cache_size,
         }
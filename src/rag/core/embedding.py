@@ -11,6 +11,11 @@ class BaseEmbedding(ABC):
     and implement the encode method.
     """
 
+    #: Whether the backing model batches internally. When True, the
+    #: default encode_batch hands the whole list to encode in one call
+    #: instead of slicing it into Python-level chunks.
+    supports_native_batching: bool = False
+
     @abstractmethod
     def encode(self, texts: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
         """Generate embeddings for input text(s)
@@ -37,6 +42,12 @@ class BaseEmbedding(ABC):
         Returns:
             List of embedding vectors
         """
+        if self.supports_native_batching:
+            # The model mini-batches internally (overlapping tokenization
+            # and device copies); slicing here would just add Python
+            # overhead and an extra concatenation
+            return self.encode(texts)
+
         embeddings = []
         for i in range(0, len(texts), batch_size):
             batch = texts[i:i + batch_size]
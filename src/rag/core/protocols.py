@@ -2,6 +2,8 @@
 
 from typing import Protocol, List, runtime_checkable
 
+import numpy as np
+
 
 @runtime_checkable
 class EmbeddingFunction(Protocol):
@@ -11,14 +13,14 @@ class EmbeddingFunction(Protocol):
     can be used as an embedding function.
     """
 
-    def __call__(self, texts: List[str]) -> List[List[float]]:
+    def __call__(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings for texts
 
         Args:
             texts: List of text strings
 
         Returns:
-            List of embedding vectors
+            Embedding matrix of shape (len(texts), dimension)
         """
         ...
 
@@ -60,6 +60,45 @@ class BaseVectorStore(ABC):
         """
         pass
 
+    def search_batch(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int = 5,
+        score_threshold: Optional[float] = None,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[List[SearchResult]]:
+        """Search for several query embeddings at once
+
+        Default implementation runs search once per query. Stores that
+        hold their vectors as a contiguous matrix should override this
+        and score all queries in a single matrix product (one BLAS GEMM
+        instead of Q matrix-vector calls); see NumPyStore.
+
+        Args:
+            query_embeddings: Query embedding vectors
+            limit: Maximum number of results per query
+            score_threshold: Optional minimum similarity score
+            filter_metadata: Optional metadata filter
+
+        Returns:
+            One result list per query, in query order
+
+        Raises:
+            ValueError: If query_embeddings is empty
+        """
+        if query_embeddings is None or len(query_embeddings) == 0:
+            raise ValueError("Query embeddings cannot be empty")
+
+        return [
+            self.search(
+                query_embedding=query_embedding,
+                limit=limit,
+                score_threshold=score_threshold,
+                filter_metadata=filter_metadata,
+            )
+            for query_embedding in query_embeddings
+        ]
+
     @abstractmethod
     def delete_documents(self, ids: List[str]) -> None:
         """Delete documents by IDs
@@ -0,0 +1,176 @@
+"""Reusable RAG demo pipeline: load, ingest, retrieve, rerank, answer"""
+
+import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .client import RAGClient
+from .document_loader import DocumentLoader
+from .reranker import Reranker
+
+logger = logging.getLogger(__name__)
+
+
+def _merge_distractors(chunks: List[str], distractors: List[str]) -> List[str]:
+    """Scatter distractors into chunks with one O(N+K) merge pass
+
+    Sampling all insertion points up front and building the output in a
+    single pass avoids the O(K*N) memmove cost of repeated list.insert.
+
+    Args:
+        chunks: Base document chunks
+        distractors: Distractor sentences to scatter among them
+
+    Returns:
+        New list with distractors placed at random positions
+    """
+    positions = sorted(
+        random.randint(0, len(chunks)) for _ in distractors
+    )
+
+    merged: List[str] = []
+    di = 0
+    for i, chunk in enumerate(chunks):
+        while di < len(positions) and positions[di] == i:
+            merged.append(distractors[di])
+            di += 1
+        merged.append(chunk)
+    merged.extend(distractors[di:])
+
+    return merged
+
+
+def run_rag_demo(
+    data_files: List[str],
+    query: str,
+    chunk_size: int = 300,
+    distractors: Optional[List[str]] = None,
+    k_search: int = 10,
+    k_rerank: int = 3,
+    client: Optional[RAGClient] = None,
+    llm_client: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """Run the full demo pipeline over a set of text files
+
+    One shared implementation for all demo entry points, so batching,
+    caching and streaming improvements apply everywhere at once instead
+    of being copy-pasted per script.
+
+    Pipeline: chunk files -> optionally mix in distractor sentences ->
+    ingest -> vector search (k_search) -> rerank (k_rerank) ->
+    optionally generate an answer with the given LLM client.
+
+    Args:
+        data_files: Paths to UTF-8 text files to ingest
+        query: Question to retrieve and answer
+        chunk_size: Target chunk size in characters
+        distractors: Optional distractor sentences mixed into the corpus
+        k_search: Number of candidates fetched by vector search
+        k_rerank: Number of results kept after reranking
+        client: Optional pre-configured RAGClient (a fresh one otherwise)
+        llm_client: Optional LLM client with generate(query, context);
+            when None the pipeline stops after reranking
+
+    Returns:
+        Dictionary with chunk_count, results (reranked), and answer
+        (None when no LLM client was given)
+    """
+    loader = DocumentLoader()
+    chunks = loader.load_multiple_files(data_files, chunk_size=chunk_size)
+
+    if distractors:
+        chunks = _merge_distractors(chunks, distractors)
+
+    if client is None:
+        client = RAGClient()
+
+    client.add_documents(chunks)
+    logger.info("Ingested %d chunks from %d files", len(chunks), len(data_files))
+
+    results = client.search(query, limit=k_search)
+    results = Reranker().rerank(query, results, top_k=k_rerank)
+
+    answer = None
+    if llm_client is not None:
+        answer = llm_client.generate(
+            query=query,
+            context=[result["content"] for result in results],
+        )
+
+    return {
+        "chunk_count": len(chunks),
+        "results": results,
+        "answer": answer,
+    }
+
+
+def run_rag_demo_multi(
+    data_files: List[str],
+    queries: List[str],
+    chunk_size: int = 300,
+    distractors: Optional[List[str]] = None,
+    k_search: int = 10,
+    k_rerank: int = 3,
+    client: Optional[RAGClient] = None,
+    llm_client: Optional[Any] = None,
+    max_workers: int = 4,
+) -> List[Dict[str, Any]]:
+    """Answer several questions over one ingested corpus
+
+    The corpus is chunked and ingested once, all query embeddings run
+    in a single batched forward pass (search_batch), and the per-question
+    LLM calls — each dominated by network RTT — are issued concurrently
+    on a thread pool, so total wall-clock approaches the slowest call
+    instead of the sum.
+
+    Args:
+        data_files: Paths to UTF-8 text files to ingest
+        queries: Questions to retrieve and answer
+        chunk_size: Target chunk size in characters
+        distractors: Optional distractor sentences mixed into the corpus
+        k_search: Number of candidates fetched by vector search
+        k_rerank: Number of results kept after reranking
+        client: Optional pre-configured RAGClient (a fresh one otherwise)
+        llm_client: Optional LLM client with generate(query, context)
+        max_workers: Concurrent LLM calls
+
+    Returns:
+        One result dictionary per query, in query order
+    """
+    loader = DocumentLoader()
+    chunks = loader.load_multiple_files(data_files, chunk_size=chunk_size)
+
+    if distractors:
+        chunks = _merge_distractors(chunks, distractors)
+
+    if client is None:
+        client = RAGClient()
+
+    client.add_documents(chunks)
+    logger.info("Ingested %d chunks from %d files", len(chunks), len(data_files))
+
+    reranker = Reranker()
+    results_lists = client.search_batch(queries, limit=k_search)
+    results_lists = reranker.rerank_batch(queries, results_lists, top_k=k_rerank)
+
+    answers: List[Optional[str]] = [None] * len(queries)
+    if llm_client is not None:
+        def _answer(index: int) -> str:
+            return llm_client.generate(
+                query=queries[index],
+                context=[r["content"] for r in results_lists[index]],
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            answers = list(pool.map(_answer, range(len(queries))))
+
+    return [
+        {
+            "query": query,
+            "chunk_count": len(chunks),
+            "results": results,
+            "answer": answer,
+        }
+        for query, results, answer in zip(queries, results_lists, answers)
+    ]
@@ -0,0 +1,130 @@
+"""Content-addressed embedding cache keyed on text content and model"""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Cache of embedding vectors addressed by content hash
+
+    Keys combine the text and the model name, so switching models never
+    serves stale vectors. The cache is safe to share between ingestion
+    threads, and can optionally persist to a JSON file so repeated runs
+    (demo scripts, benchmark loops) only embed genuinely new chunks.
+
+    Examples:
+        >>> cache = EmbeddingCache(cache_path="./embedding_cache.json")
+        >>> vectors = cache.get_or_compute_many(
+        ...     texts=chunks,
+        ...     model_name=embedding.model_name,
+        ...     compute_batch=embedding.encode_batch,
+        ... )
+    """
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = None):
+        """Initialize embedding cache
+
+        Args:
+            cache_path: Optional JSON file for persistence across runs
+        """
+        self._vectors: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._cache_path = Path(cache_path) if cache_path else None
+        self.hits = 0
+        self.misses = 0
+
+        if self._cache_path and self._cache_path.is_file():
+            try:
+                self._vectors = json.loads(
+                    self._cache_path.read_text(encoding="utf-8")
+                )
+                logger.info(
+                    "Loaded %d cached embeddings from %s",
+                    len(self._vectors), self._cache_path,
+                )
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning("Ignoring corrupt embedding cache: %s", e)
+                self._vectors = {}
+
+    @staticmethod
+    def compute_key(text: str, model_name: str) -> str:
+        """Compute the cache key for a text/model pair
+
+        Args:
+            text: Document text
+            model_name: Embedding model identifier (cache namespace)
+
+        Returns:
+            Hex digest key
+        """
+        return hashlib.sha256(
+            f"{model_name}:{text}".encode("utf-8")
+        ).hexdigest()
+
+    def get_or_compute_many(
+        self,
+        texts: List[str],
+        model_name: str,
+        compute_batch: Callable[[List[str]], List[List[float]]],
+    ) -> List[List[float]]:
+        """Return embeddings for all texts, computing only cache misses
+
+        Args:
+            texts: Texts to embed
+            model_name: Embedding model identifier (cache namespace)
+            compute_batch: Callable that embeds a list of texts
+
+        Returns:
+            One embedding vector per input text, in input order
+        """
+        keys = [self.compute_key(text, model_name) for text in texts]
+
+        with self._lock:
+            missing = {
+                key: text
+                for key, text in zip(keys, texts)
+                if key not in self._vectors
+            }
+
+        if missing:
+            vectors = compute_batch(list(missing.values()))
+            # This cache persists to JSON, so ndarray results are
+            # materialized as plain lists here at its boundary
+            if hasattr(vectors, "tolist"):
+                vectors = vectors.tolist()
+            if vectors and not isinstance(vectors[0], list):
+                vectors = [vectors]
+            with self._lock:
+                for key, vector in zip(missing.keys(), vectors):
+                    self._vectors[key] = vector
+                self.misses += len(missing)
+                self.hits += len(texts) - len(missing)
+            self._persist()
+        else:
+            with self._lock:
+                self.hits += len(texts)
+
+        with self._lock:
+            return [self._vectors[key] for key in keys]
+
+    def _persist(self) -> None:
+        """Write the cache to disk if a cache path is configured"""
+        if self._cache_path is None:
+            return
+
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                payload = json.dumps(self._vectors)
+            self._cache_path.write_text(payload, encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to persist embedding cache: %s", e)
+
+    def __len__(self) -> int:
+        return len(self._vectors)
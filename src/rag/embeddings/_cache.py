@@ -0,0 +1,119 @@
+"""Bounded LRU cache for encoder-level embedding reuse"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+
+class EncoderLRUCache:
+    """Thread-safe LRU cache of embedding vectors keyed by text digest
+
+    Lives inside one encoder instance, so unlike the pipeline-level
+    EmbeddingCache it needs no model-name component in its keys and is
+    bounded: repeated queries and duplicate chunks skip the model
+    forward pass while memory stays capped at max_size vectors.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize the cache
+
+        Args:
+            max_size: Maximum number of vectors to retain
+
+        Raises:
+            ValueError: If max_size is not positive
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self._max_size = max_size
+        self._vectors: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(text: str) -> bytes:
+        """Compute the 16-byte digest key for a text
+
+        Args:
+            text: Input text
+
+        Returns:
+            Truncated SHA-256 digest of the UTF-8 encoded text
+        """
+        return hashlib.sha256(text.encode("utf-8")).digest()[:16]
+
+    def get(self, key: bytes) -> Optional[List[float]]:
+        """Look up a vector, refreshing its LRU position on hit
+
+        Args:
+            key: Digest key from key_for
+
+        Returns:
+            Cached vector, or None on miss
+        """
+        with self._lock:
+            vector = self._vectors.get(key)
+            if vector is not None:
+                self._vectors.move_to_end(key)
+            return vector
+
+    def put(self, key: bytes, vector: List[float]) -> None:
+        """Store a vector, evicting the least recently used on overflow
+
+        Args:
+            key: Digest key from key_for
+            vector: Embedding vector to cache
+        """
+        with self._lock:
+            self._vectors[key] = vector
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self._max_size:
+                self._vectors.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+
+def encode_with_cache(
+    cache: EncoderLRUCache,
+    texts: List[str],
+    encode_misses: Callable[[List[str]], List[List[float]]],
+) -> List[List[float]]:
+    """Encode texts, serving repeats from the cache
+
+    Texts are partitioned into hits and misses; only the misses (each
+    distinct text once) go through the model, then the output is
+    reassembled in input order and the new vectors are cached.
+
+    Args:
+        cache: Cache to consult and fill
+        texts: Texts to encode
+        encode_misses: Callback encoding a list of uncached texts
+
+    Returns:
+        One embedding vector per input text, in input order
+    """
+    keys = [cache.key_for(text) for text in texts]
+    vectors: List[Optional[List[float]]] = [cache.get(key) for key in keys]
+
+    miss_keys = []
+    miss_texts = []
+    seen = set()
+    for key, text, vector in zip(keys, texts, vectors):
+        if vector is None and key not in seen:
+            seen.add(key)
+            miss_keys.append(key)
+            miss_texts.append(text)
+
+    if miss_texts:
+        encoded = encode_misses(miss_texts)
+        vector_by_key = dict(zip(miss_keys, encoded))
+        for key, vector in vector_by_key.items():
+            cache.put(key, vector)
+        vectors = [
+            vector if vector is not None else vector_by_key[key]
+            for key, vector in zip(keys, vectors)
+        ]
+
+    return vectors
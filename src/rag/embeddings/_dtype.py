@@ -0,0 +1,76 @@
+"""Reduced-precision helpers for embedding model weights"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import torch
+    _HAS_TORCH = True
+except ImportError:
+    _HAS_TORCH = False
+
+SUPPORTED_DTYPES = ("float32", "float16", "bfloat16")
+
+
+def cast_model_dtype(model, dtype: Optional[str]):
+    """Cast a torch-backed embedding model to reduced precision
+
+    Half-precision weights halve the memory traffic of the forward
+    pass, which is where dense encoders spend their time; bfloat16
+    keeps the fp32 exponent range and is the safer choice on hardware
+    that supports it (Ampere GPUs, AVX512-BF16 CPUs), float16 is the
+    fallback elsewhere.
+
+    "float32" or None leaves the model untouched. When torch is not
+    importable, or the model exposes no castable module, the request
+    is logged and ignored rather than raised — precision is a tuning
+    knob, not a correctness requirement.
+
+    Args:
+        model: Embedding model wrapper (SentenceTransformer is itself a
+            torch module; SentenceModel holds one under .model / .bert)
+        dtype: One of "float32", "float16", "bfloat16", or None
+
+    Returns:
+        The model, cast in place when possible
+
+    Raises:
+        ValueError: If dtype is not a supported name
+    """
+    if dtype is None or dtype == "float32":
+        return model
+
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(
+            f"Unsupported dtype: {dtype}. "
+            f"Supported dtypes: {list(SUPPORTED_DTYPES)}"
+        )
+
+    if not _HAS_TORCH:
+        logger.warning("torch not available, keeping %s in float32", type(model).__name__)
+        return model
+
+    target = model
+    if not isinstance(target, torch.nn.Module):
+        target = getattr(model, "model", None) or getattr(model, "bert", None)
+
+    if not isinstance(target, torch.nn.Module):
+        logger.warning(
+            "No torch module found on %s, keeping float32", type(model).__name__
+        )
+        return model
+
+    target.to(getattr(torch, dtype))
+    logger.info("Cast %s weights to %s", type(model).__name__, dtype)
+    return model
+
+
+def release_cuda_memory() -> None:
+    """Return freed GPU memory to the driver after dropping a model
+
+    No-op when torch is unavailable or no CUDA device is present.
+    """
+    if _HAS_TORCH and torch.cuda.is_available():
+        torch.cuda.empty_cache()
@@ -0,0 +1,159 @@
+"""SQLite-backed persistent cache of embedding vectors"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# SQLite caps bound parameters per statement; stay well under it
+_MAX_QUERY_KEYS = 500
+
+
+class PersistentEmbeddingCache:
+    """Embedding vectors persisted to SQLite, keyed by text digest
+
+    Complements the in-memory EncoderLRUCache: vectors survive process
+    restarts, so re-ingesting an unchanged corpus costs SELECTs instead
+    of model forward passes. Vectors are stored as float16 blobs (half
+    the footprint of float32, ~0.8 KB per 768-dim entry) and promoted
+    back to float32 lists on read; the quantization error is far below
+    what cosine ranking can resolve.
+
+    The database uses WAL journaling with NORMAL synchronous writes,
+    so readers never block behind the insert batches.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """Open or create the cache database
+
+        Args:
+            db_path: Path of the SQLite file (parent dirs are created)
+        """
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS emb_cache ("
+            "key BLOB PRIMARY KEY, "
+            "vec BLOB NOT NULL, "
+            "dim INTEGER NOT NULL, "
+            "dtype TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key_for(text: str) -> bytes:
+        """Compute the 16-byte digest key for a text
+
+        Args:
+            text: Input text
+
+        Returns:
+            Truncated SHA-256 digest of the UTF-8 encoded text
+        """
+        return hashlib.sha256(text.encode("utf-8")).digest()[:16]
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, List[float]]:
+        """Fetch cached vectors for the given keys
+
+        Args:
+            keys: Digest keys from key_for
+
+        Returns:
+            Mapping of found keys to float32 vectors (misses absent)
+        """
+        found: Dict[bytes, List[float]] = {}
+        with self._lock:
+            for start in range(0, len(keys), _MAX_QUERY_KEYS):
+                batch = keys[start:start + _MAX_QUERY_KEYS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vec, dtype FROM emb_cache WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, blob, dtype in rows:
+                    vector = np.frombuffer(blob, dtype=np.dtype(dtype))
+                    found[key] = vector.astype(np.float32).tolist()
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, List[float]]]) -> None:
+        """Insert or replace vectors in one transaction
+
+        Args:
+            items: (key, vector) pairs to persist
+        """
+        rows = []
+        for key, vector in items:
+            blob = np.asarray(vector, dtype=np.float16)
+            rows.append((key, blob.tobytes(), blob.shape[0], "float16"))
+
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO emb_cache (key, vec, dim, dtype) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM emb_cache"
+            ).fetchone()[0]
+
+
+def fetch_or_encode(
+    cache: PersistentEmbeddingCache,
+    texts: List[str],
+    encode_misses: Callable[[List[str]], List[List[float]]],
+) -> List[List[float]]:
+    """Encode texts, serving previously persisted vectors from SQLite
+
+    Same partition/reassemble contract as _cache.encode_with_cache, so
+    the encoders can stack it under their in-memory LRU: only texts
+    absent from the database reach the model, and their vectors are
+    persisted for the next process.
+
+    Args:
+        cache: Persistent cache to consult and fill
+        texts: Texts to encode
+        encode_misses: Callback encoding a list of uncached texts
+
+    Returns:
+        One embedding vector per input text, in input order
+    """
+    keys = [cache.key_for(text) for text in texts]
+    found = cache.get_many(keys)
+
+    miss_keys = []
+    miss_texts = []
+    seen = set()
+    for key, text in zip(keys, texts):
+        if key not in found and key not in seen:
+            seen.add(key)
+            miss_keys.append(key)
+            miss_texts.append(text)
+
+    if miss_texts:
+        encoded = encode_misses(miss_texts)
+        cache.put_many(zip(miss_keys, encoded))
+        found.update(zip(miss_keys, encoded))
+
+    return [found[key] for key in keys]
@@ -0,0 +1,184 @@
+"""Micro-batching wrapper coalescing concurrent encode calls"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Union
+
+from ..core.embedding import BaseEmbedding
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingEncoder(BaseEmbedding):
+    """Coalesce concurrent encode() calls into one forward pass
+
+    A transformer forward pass has fixed per-call overhead, so many
+    concurrent single-query encode() calls (the typical chatbot load)
+    waste most of their latency on dispatch. This wrapper enqueues each
+    call and lets a background worker drain the queue — up to max_batch
+    texts or until max_wait elapses — into one model call, then splits
+    the result back along the original call boundaries.
+
+    Callers keep the synchronous BaseEmbedding API; each call simply
+    blocks on a future until its slice of the batch is ready. Under a
+    threaded server this turns N concurrent queries into roughly one
+    forward pass instead of N.
+
+    Example:
+        >>> embedding = BatchingEncoder(GTEEmbedding())
+        >>> vector = embedding.encode("查询文本")  # may share a pass
+        >>> embedding.close()
+    """
+
+    supports_native_batching = True
+
+    def __init__(
+        self,
+        inner: BaseEmbedding,
+        max_batch: int = 128,
+        max_wait: float = 0.005,
+    ):
+        """Wrap an embedding model with a coalescing queue
+
+        Args:
+            inner: Embedding model performing the actual forward passes
+            max_batch: Maximum texts merged into one model call
+            max_wait: Seconds the worker waits for more requests after
+                the first one arrives before dispatching the batch
+
+        Raises:
+            ValueError: If max_batch or max_wait is not positive
+        """
+        if max_batch <= 0:
+            raise ValueError(f"max_batch must be positive, got {max_batch}")
+        if max_wait <= 0:
+            raise ValueError(f"max_wait must be positive, got {max_wait}")
+
+        self._inner = inner
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._worker_loop, name="batching-encoder", daemon=True
+        )
+        self._worker.start()
+
+    def encode(self, texts: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
+        """Generate embeddings, possibly sharing a forward pass
+
+        Args:
+            texts: Single text string or list of text strings
+
+        Returns:
+            Single embedding vector or list of embedding vectors
+
+        Raises:
+            RuntimeError: If the encoder has been closed
+        """
+        if self._closed:
+            raise RuntimeError("BatchingEncoder is closed")
+
+        is_single = isinstance(texts, str)
+        batch = [texts] if is_single else list(texts)
+
+        future: "Future" = Future()
+        self._queue.put((batch, future))
+        embeddings = future.result()
+        return embeddings[0] if is_single else embeddings
+
+    def encode_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        """Generate embeddings for an already-batched list
+
+        Bulk ingestion is batched by the caller, so it bypasses the
+        coalescing queue and goes straight to the inner model.
+
+        Args:
+            texts: List of text strings
+            batch_size: Mini-batch size forwarded to the inner model
+
+        Returns:
+            List of embedding vectors
+        """
+        return self._inner.encode_batch(texts, batch_size=batch_size)
+
+    def close(self) -> None:
+        """Stop the worker thread; pending requests are still served"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join()
+
+    def _worker_loop(self) -> None:
+        """Drain the queue into coalesced model calls until closed"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            requests = [item]
+            total = len(item[0])
+
+            # Coalesce: wait up to max_wait for more requests, capped
+            # at max_batch texts overall
+            end = time.monotonic() + self._max_wait
+            while total < self._max_batch:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    self._dispatch(requests)
+                    return
+                requests.append(nxt)
+                total += len(nxt[0])
+
+            self._dispatch(requests)
+
+    def _dispatch(self, requests: List[tuple]) -> None:
+        """Run one forward pass and split results per caller
+
+        Args:
+            requests: (texts, future) pairs drained from the queue
+        """
+        combined: List[str] = []
+        for batch, _ in requests:
+            combined.extend(batch)
+
+        try:
+            embeddings = self._inner.encode(combined)
+        except Exception as e:
+            logger.error(f"Batched encode failed for {len(combined)} texts: {e}")
+            for _, future in requests:
+                future.set_exception(e)
+            return
+
+        offset = 0
+        for batch, future in requests:
+            future.set_result(embeddings[offset:offset + len(batch)])
+            offset += len(batch)
+
+    @property
+    def dimension(self) -> int:
+        """Get embedding dimension of the wrapped model
+
+        Returns:
+            Dimension of the embedding vectors
+        """
+        return self._inner.dimension
+
+    @property
+    def model_name(self) -> str:
+        """Get model name of the wrapped model
+
+        Returns:
+            Name of the embedding model
+        """
+        return self._inner.model_name
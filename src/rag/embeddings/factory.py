@@ -1,20 +1,34 @@
 """Factory for creating embedding model instances"""
 
-from typing import Literal
+import logging
+from typing import Literal, Optional
 from ..core.embedding import BaseEmbedding
 from .text2vec import Text2VecEmbedding
 from .gte import GTEEmbedding
+from .tei import TEIEmbedding
+
+logger = logging.getLogger(__name__)
 
 
 def create_embedding(
-    provider: Literal["text2vec", "gte"],
-    model_name: str
+    provider: Literal["text2vec", "gte", "model2vec", "tei"],
+    model_name: str,
+    dtype: Optional[str] = None,
+    cache_size: int = 0,
+    cache_path: Optional[str] = None,
 ) -> BaseEmbedding:
     """Create embedding model instance from provider and model name
 
     Args:
-        provider: Embedding provider ("text2vec" or "gte")
+        provider: Embedding provider ("text2vec", "gte", "model2vec" or "tei")
         model_name: Model name/identifier on HuggingFace
+        dtype: Weight precision for torch-backed providers ("float32",
+            "float16", "bfloat16"); ignored by providers without local
+            torch weights
+        cache_size: Encoder-level LRU cache size for torch-backed
+            providers (0 disables)
+        cache_path: SQLite file persisting encoder vectors across
+            process restarts for torch-backed providers (None disables)
 
     Returns:
         BaseEmbedding instance
@@ -26,9 +40,15 @@ def create_embedding(
         >>> embedding = create_embedding("gte", "thenlper/gte-base-zh")
         >>> embedding = create_embedding("text2vec", "shibing624/text2vec-base-chinese")
     """
+    if provider == "model2vec":
+        # Imported lazily: model2vec is an optional dependency
+        from .model2vec import Model2VecEmbedding
+        return Model2VecEmbedding(model_name=model_name)
+
     providers = {
         "text2vec": Text2VecEmbedding,
         "gte": GTEEmbedding,
+        "tei": TEIEmbedding,
     }
 
     if provider not in providers:
@@ -37,4 +57,14 @@ def create_embedding(
             f"Supported providers: {list(providers.keys())}"
         )
 
+    if provider in ("text2vec", "gte"):
+        return providers[provider](
+            model_name=model_name,
+            dtype=dtype,
+            cache_size=cache_size,
+            cache_path=cache_path,
+        )
+
+    if dtype is not None:
+        logger.debug("Provider %s has no local torch weights, dtype ignored", provider)
     return providers[provider](model_name=model_name)
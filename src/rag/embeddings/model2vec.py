@@ -0,0 +1,87 @@
+"""Model2Vec static embedding implementation"""
+
+from typing import List, Union
+from ..core.embedding import BaseEmbedding
+
+
+class Model2VecEmbedding(BaseEmbedding):
+    """Model2Vec static embedding model
+
+    Model2Vec replaces the transformer forward pass with a static token
+    lookup plus mean pooling (pure NumPy), making it roughly an order of
+    magnitude faster than SentenceTransformers for batch ingestion at a
+    modest accuracy cost.
+
+    Requires the optional `model2vec` package:
+        pip install model2vec
+    """
+
+    def __init__(self, model_name: str = "minishlab/potion-base-8M"):
+        """Initialize Model2Vec embedding model
+
+        Args:
+            model_name: Name of the Model2Vec model on HuggingFace
+
+        Raises:
+            ImportError: If the model2vec package is not installed
+        """
+        try:
+            from model2vec import StaticModel
+        except ImportError as e:
+            raise ImportError(
+                "model2vec is required for the 'model2vec' embedding provider. "
+                "Install it with: pip install model2vec"
+            ) from e
+
+        self._model_name = model_name
+        self._model = StaticModel.from_pretrained(model_name)
+        self._dimension = None
+
+    def encode(self, texts: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
+        """Generate embeddings for input text(s)
+
+        Args:
+            texts: Single text string or list of text strings
+
+        Returns:
+            Single embedding vector or list of embedding vectors
+        """
+        is_single = isinstance(texts, str)
+
+        if is_single:
+            texts = [texts]
+
+        # Static lookup + mean pooling (no transformer forward pass)
+        embeddings = self._model.encode(texts)
+
+        # Convert to list format
+        if hasattr(embeddings, 'tolist'):
+            embeddings = embeddings.tolist()
+
+        # Cache dimension on first use
+        if self._dimension is None and len(embeddings) > 0:
+            self._dimension = len(embeddings[0])
+
+        return embeddings[0] if is_single else embeddings
+
+    @property
+    def dimension(self) -> int:
+        """Get embedding dimension
+
+        Returns:
+            Dimension of the embedding vectors
+        """
+        if self._dimension is None:
+            # Initialize dimension by encoding a dummy text
+            dummy_embedding = self.encode("test")
+            self._dimension = len(dummy_embedding)
+        return self._dimension
+
+    @property
+    def model_name(self) -> str:
+        """Get model name
+
+        Returns:
+            Name of the embedding model
+        """
+        return self._model_name
@@ -0,0 +1,102 @@
+"""Text-Embeddings-Inference (TEI) client embedding implementation"""
+
+import os
+from typing import List, Union
+
+import requests
+
+from ..core.embedding import BaseEmbedding
+
+
+class TEIEmbedding(BaseEmbedding):
+    """Embedding client for a Hugging Face TEI sidecar server
+
+    Instead of loading the embedding model in-process, requests are sent
+    to a Text-Embeddings-Inference server which performs token-based
+    dynamic batching across all concurrent callers. This frees the Python
+    process of the model memory and lets multiple workers share one
+    batched backend.
+
+    The server address defaults to the TEI_BASE_URL environment variable
+    (falling back to http://localhost:8080).
+    """
+
+    def __init__(
+        self,
+        model_name: str = "tei",
+        base_url: str = None,
+        timeout: float = 30.0,
+    ):
+        """Initialize TEI embedding client
+
+        Args:
+            model_name: Display name for the remote model
+            base_url: Base URL of the TEI server (defaults to TEI_BASE_URL
+                env var or http://localhost:8080)
+            timeout: Request timeout in seconds
+        """
+        if base_url is None:
+            base_url = os.getenv("TEI_BASE_URL", "http://localhost:8080")
+
+        self._model_name = model_name
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        # Keep-alive connection pool shared across encode calls
+        self._session = requests.Session()
+        self._dimension = None
+
+    def encode(self, texts: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
+        """Generate embeddings for input text(s)
+
+        Args:
+            texts: Single text string or list of text strings
+
+        Returns:
+            Single embedding vector or list of embedding vectors
+
+        Raises:
+            RuntimeError: If the TEI server request fails
+        """
+        is_single = isinstance(texts, str)
+
+        if is_single:
+            texts = [texts]
+
+        try:
+            response = self._session.post(
+                f"{self._base_url}/embed",
+                json={"inputs": texts},
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+            embeddings = response.json()
+        except Exception as e:
+            raise RuntimeError(f"TEI embedding request failed: {e}") from e
+
+        # Cache dimension on first use
+        if self._dimension is None and len(embeddings) > 0:
+            self._dimension = len(embeddings[0])
+
+        return embeddings[0] if is_single else embeddings
+
+    @property
+    def dimension(self) -> int:
+        """Get embedding dimension
+
+        Returns:
+            Dimension of the embedding vectors
+        """
+        if self._dimension is None:
+            # Initialize dimension by encoding a dummy text
+            dummy_embedding = self.encode("test")
+            self._dimension = len(dummy_embedding)
+        return self._dimension
+
+    @property
+    def model_name(self) -> str:
+        """Get model name
+
+        Returns:
+            Name of the embedding model
+        """
+        return self._model_name
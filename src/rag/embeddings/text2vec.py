@@ -1,8 +1,15 @@
 """Text2Vec embedding implementation"""
 
-from typing import List, Union
+import gc
+import threading
+from typing import List, Optional, Union
+
+import numpy as np
 from text2vec import SentenceModel
 from ..core.embedding import BaseEmbedding
+from ._cache import EncoderLRUCache, encode_with_cache
+from ._dtype import cast_model_dtype, release_cuda_memory
+from ._persistent_cache import PersistentEmbeddingCache, fetch_or_encode
 
 
 class Text2VecEmbedding(BaseEmbedding):
@@ -12,37 +19,87 @@ class Text2VecEmbedding(BaseEmbedding):
     embeddings optimized for Chinese language processing.
     """
 
-    def __init__(self, model_name: str = "shibing624/text2vec-base-chinese"):
+    supports_native_batching = True
+
+    def __init__(
+        self,
+        model_name: str = "shibing624/text2vec-base-chinese",
+        dtype: Optional[str] = None,
+        cache_size: int = 0,
+        cache_path: Optional[str] = None,
+    ):
         """Initialize Text2Vec embedding model
 
         Args:
             model_name: Name of the text2vec model to use
+            dtype: Weight precision ("float32", "float16" or "bfloat16").
+                Half precision halves memory bandwidth during encoding;
+                None keeps the default float32
+            cache_size: Number of embeddings to retain in an LRU cache
+                keyed by text digest; repeated texts skip the forward
+                pass. 0 disables caching
+            cache_path: SQLite file persisting embeddings across process
+                restarts; texts already encoded in a previous run skip
+                the forward pass. None disables persistence
+
+        Note:
+            The model weights are loaded lazily on first encode, so
+            constructing an instance (e.g. only to read model_name) is
+            cheap and does not pull hundreds of MB into memory.
         """
         self._model_name = model_name
-        self._model = SentenceModel(model_name)
+        self._dtype = dtype
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._cache = EncoderLRUCache(cache_size) if cache_size > 0 else None
+        self._persistent = (
+            PersistentEmbeddingCache(cache_path) if cache_path else None
+        )
         # Get dimension from first encoding (lazy evaluation)
         self._dimension = None
 
-    def encode(self, texts: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
+    @property
+    def _m(self) -> SentenceModel:
+        """Load the model on first use (thread-safe)
+
+        Returns:
+            The underlying SentenceModel, cast to the requested dtype
+        """
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = cast_model_dtype(
+                        SentenceModel(self._model_name), self._dtype
+                    )
+        return self._model
+
+    def close(self) -> None:
+        """Release the model weights; the next encode reloads them
+
+        Frees CPU and GPU memory between ingestion batches. Caches are
+        kept, so previously seen texts still skip the forward pass.
+        """
+        with self._model_lock:
+            self._model = None
+        gc.collect()
+        release_cuda_memory()
+
+    def encode(self, texts: Union[str, List[str]]) -> np.ndarray:
         """Generate embeddings for input text(s)
 
         Args:
             texts: Single text string or list of text strings
 
         Returns:
-            Single embedding vector or list of embedding vectors
+            float32 embedding vector of shape (dimension,) for a single
+            text, or matrix of shape (len(texts), dimension) for a list
         """
         is_single = isinstance(texts, str)
 
         if is_single:
             texts = [texts]
 
-        # Generate embeddings
-        embeddings = self._model.encode(texts)
-
-        # Convert to list format
-        if hasattr(embeddings, 'tolist'):
-            embeddings = embeddings.tolist()
+        embeddings = self._encode_through_caches(texts)
 
         # Cache dimension on first use
         if self._dimension is None and len(embeddings) > 0:
@@ -50,6 +107,81 @@ class Text2VecEmbedding(BaseEmbedding):
 
         return embeddings[0] if is_single else embeddings
 
+    def _encode_raw(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """Run the model forward pass
+
+        Args:
+            texts: List of text strings
+            batch_size: Optional mini-batch size forwarded to the model
+
+        Returns:
+            float32 embedding matrix of shape (len(texts), dimension)
+        """
+        if batch_size is None:
+            embeddings = self._m.encode(texts)
+        else:
+            embeddings = self._m.encode(
+                texts, batch_size=batch_size, show_progress_bar=False
+            )
+
+        # Keep the model's ndarray: a (N, d) float32 block is ~6x
+        # smaller than a list of Python floats and feeds the vector
+        # store without conversion
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _encode_through_caches(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """Encode texts through the configured cache layers
+
+        Layering order: in-memory LRU first (no I/O), then the SQLite
+        persistent cache, and only the remaining misses reach the model.
+
+        Args:
+            texts: List of text strings
+            batch_size: Optional mini-batch size forwarded to the model
+
+        Returns:
+            float32 embedding matrix of shape (len(texts), dimension)
+        """
+        def encode(misses: List[str]):
+            return self._encode_raw(misses, batch_size=batch_size)
+
+        if self._persistent is not None:
+            raw_encode = encode
+
+            def encode(misses: List[str]):
+                return fetch_or_encode(self._persistent, misses, raw_encode)
+
+        if self._cache is not None:
+            # Cache reassembly yields a row list; restack into a matrix
+            return np.asarray(
+                encode_with_cache(self._cache, texts, encode), dtype=np.float32
+            )
+        return np.asarray(encode(texts), dtype=np.float32)
+
+    def encode_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """Generate embeddings in batches
+
+        Hands the whole list to the underlying SentenceModel, which
+        mini-batches internally with batched tokenization; slicing
+        at the Python level would only add per-chunk overhead. With a
+        cache configured, repeated texts never reach the model.
+
+        Args:
+            texts: List of text strings
+            batch_size: Mini-batch size forwarded to the model
+
+        Returns:
+            float32 embedding matrix of shape (len(texts), dimension)
+        """
+        embeddings = self._encode_through_caches(texts, batch_size=batch_size)
+
+        if self._dimension is None and len(embeddings) > 0:
+            self._dimension = len(embeddings[0])
+
+        return embeddings
+
     @property
     def dimension(self) -> int:
         """Get embedding dimension
@@ -0,0 +1,358 @@
+"""Long-context test framework for LLM needle retrieval accuracy"""
+
+import hashlib
+import logging
+import random
+from typing import Callable, List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from .core.embedding import BaseEmbedding
+from .llm_client import LLMClient
+
+logger = logging.getLogger(__name__)
+
+# Filler sentence repeated to pad the context to the target length
+DEFAULT_FILLER_SENTENCE = "这是一段背景叙述，描述了一些日常生活中的普通事情，没有特别重要的信息。"
+
+# Above this sampling temperature responses are too stochastic for a
+# cached answer to stand in for a fresh one, so the cache disables itself
+_CACHE_MAX_TEMPERATURE = 0.3
+
+
+class SemanticLLMCache:
+    """Cache of LLM responses keyed by prompt embedding within a namespace
+
+    Semantic matching cannot key on the full long context: the
+    supported embedders truncate input to a few hundred tokens, so two
+    contexts differing only past the truncation point (different sizes
+    or needle depths over the same filler) would embed to near-identical
+    vectors and wrongly share an answer. Callers therefore pass a
+    namespace — an exact identity for everything the embedding cannot
+    see (e.g. a hash of the full context) — and cosine matching only
+    runs between prompts in the same namespace.
+
+    Within a namespace, prompts are embedded once and kept as unit rows
+    of a float32 matrix; a lookup is a single matrix-vector cosine
+    product. A hit (similarity above the threshold) returns the stored
+    response without touching the network, turning a multi-second
+    inference into a millisecond vector product.
+
+    The threshold defaults to 0.98: high enough that only prompts the
+    embedding model considers practically identical share an answer.
+
+    Examples:
+        >>> cache = SemanticLLMCache(embedding)
+        >>> answer, hit = cache.get_or_generate(
+        ...     prompt, lambda: llm.generate(...), namespace=context_hash
+        ... )
+    """
+
+    def __init__(
+        self,
+        embedding: BaseEmbedding,
+        similarity_threshold: float = 0.98,
+    ):
+        """Initialize semantic LLM cache
+
+        Args:
+            embedding: Embedding model used to key prompts
+            similarity_threshold: Minimum cosine similarity for a hit
+
+        Raises:
+            ValueError: If similarity_threshold is outside (0, 1]
+        """
+        if not 0.0 < similarity_threshold <= 1.0:
+            raise ValueError(
+                f"similarity_threshold must be in (0, 1], got {similarity_threshold}"
+            )
+
+        self._embedding = embedding
+        self._threshold = similarity_threshold
+        # Per namespace: (N, d) float32 unit rows and parallel responses
+        self._keys: Dict[str, np.ndarray] = {}
+        self._responses: Dict[str, List[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _encode_key(self, text: str) -> np.ndarray:
+        """Embed a prompt as a unit-norm float32 vector"""
+        vector = np.asarray(self._embedding.encode(text), dtype=np.float32)
+        vector = vector.reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        if norm > 0:
+            vector = vector / norm
+        return vector
+
+    def get_or_generate(
+        self,
+        prompt: str,
+        generate: Callable[[], str],
+        namespace: str = "",
+    ) -> Tuple[str, bool]:
+        """Return a cached response for the prompt, generating on a miss
+
+        The prompt is embedded exactly once; on a miss the same vector
+        is appended as the key for the freshly generated response.
+        Cosine matching only considers entries of the same namespace.
+
+        Args:
+            prompt: Prompt text short enough for the embedder to see in
+                full (e.g. system prompt + question)
+            generate: Callable issuing the actual LLM request
+            namespace: Exact identity of anything the embedding cannot
+                represent, such as a hash of the full context
+
+        Returns:
+            Tuple of (response, whether it was served from the cache)
+        """
+        key = self._encode_key(prompt)
+        keys = self._keys.get(namespace)
+        responses = self._responses.get(namespace)
+
+        if keys is not None and responses:
+            # One cosine product against every cached key in the namespace
+            scores = keys @ key
+            best = int(np.argmax(scores))
+            if float(scores[best]) >= self._threshold:
+                self.hits += 1
+                return responses[best], True
+
+        response = generate()
+        self.misses += 1
+
+        row = key[None, :]
+        self._keys[namespace] = row if keys is None else np.vstack([keys, row])
+        self._responses.setdefault(namespace, []).append(response)
+
+        return response, False
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())
+
+
+class LongContextTest:
+    """Needle-in-haystack test for LLM long-context understanding
+
+    Unlike NeedleTest, which measures whether retrieval surfaces the
+    needle, this test hands the LLM the whole context directly and
+    checks whether the answer survives at various context lengths and
+    needle depths — the classic long-context evaluation matrix.
+
+    When an embedding model is injected, LLM calls go through a
+    SemanticLLMCache namespaced by the exact context: repeated trials
+    of a (size, depth) cell re-send the same deterministic context and
+    question, so they become vector lookups instead of network
+    round-trips, while different cells can never share an answer. The
+    cache stays off while the client samples at temperature above 0.3,
+    where replaying one cached answer would misrepresent the model's
+    behavior.
+
+    Examples:
+        >>> llm = LLMClient(api_key="...", temperature=0.0)
+        >>> tester = LongContextTest(llm, embedding=Text2VecEmbedding())
+        >>> result = tester.run_test(
+        ...     needle="秘密答案是：42",
+        ...     context_size=4000,
+        ...     depth_percent=50,
+        ...     question="秘密答案是什么？"
+        ... )
+        >>> result["needle_found"]
+        True
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        embedding: Optional[BaseEmbedding] = None,
+        cache_similarity_threshold: float = 0.98,
+    ):
+        """Initialize long-context test
+
+        Args:
+            llm_client: LLM client used to answer over the context
+            embedding: Optional embedding model enabling the semantic
+                response cache (None runs every call against the API)
+            cache_similarity_threshold: Minimum cosine similarity for
+                a cached response to be reused
+        """
+        self.llm_client = llm_client
+        self._cache = (
+            SemanticLLMCache(embedding, cache_similarity_threshold)
+            if embedding is not None
+            else None
+        )
+
+    @property
+    def cache_hits(self) -> int:
+        """Number of LLM calls served from the semantic cache"""
+        return self._cache.hits if self._cache is not None else 0
+
+    def _cache_enabled(self) -> bool:
+        """Whether the semantic cache applies to the current client"""
+        if self._cache is None:
+            return False
+        temperature = getattr(self.llm_client, "temperature", 0.0)
+        return temperature <= _CACHE_MAX_TEMPERATURE
+
+    def build_context(
+        self,
+        needle: str,
+        context_size: int,
+        depth_percent: float,
+        filler_sentence: str = DEFAULT_FILLER_SENTENCE,
+    ) -> str:
+        """Build a context of roughly the target size with the needle inserted
+
+        Args:
+            needle: Needle sentence containing the target information
+            context_size: Approximate context length in characters
+            depth_percent: Needle position as a percentage of the
+                context (0 = start, 100 = end)
+            filler_sentence: Sentence repeated to pad the context
+
+        Returns:
+            Context string with the needle at the requested depth
+
+        Raises:
+            ValueError: If context_size is not positive or
+                depth_percent is outside [0, 100]
+        """
+        if context_size <= 0:
+            raise ValueError(f"context_size must be positive, got {context_size}")
+        if not 0 <= depth_percent <= 100:
+            raise ValueError(
+                f"depth_percent must be in [0, 100], got {depth_percent}"
+            )
+
+        repeats = max(1, context_size // len(filler_sentence))
+        sentences = [filler_sentence] * repeats
+        position = round(len(sentences) * depth_percent / 100)
+        sentences.insert(position, needle)
+
+        return "".join(sentences)
+
+    def run_test(
+        self,
+        needle: str,
+        context_size: int,
+        depth_percent: Optional[float] = None,
+        question: Optional[str] = None,
+        expected_answer: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Run a single long-context needle test
+
+        Args:
+            needle: Needle sentence containing the target information
+            context_size: Approximate context length in characters
+            depth_percent: Needle depth percentage (random if None)
+            question: Question posed to the LLM (defaults to the needle)
+            expected_answer: Substring the response must contain for
+                the trial to count as found (defaults to the needle)
+            system_prompt: Optional system prompt forwarded to the LLM
+
+        Returns:
+            Dictionary with test results (context_size, depth_percent,
+            needle_found, response, cache_hit, cache_hits)
+        """
+        if depth_percent is None:
+            depth_percent = random.uniform(0, 100)
+        if question is None:
+            question = needle
+        if expected_answer is None:
+            expected_answer = needle
+
+        context = self.build_context(needle, context_size, depth_percent)
+
+        def call_llm() -> str:
+            return self.llm_client.generate(
+                query=question,
+                context=[context],
+                system_prompt=system_prompt,
+            )
+
+        if self._cache_enabled():
+            # The embedder only sees the short question; the context —
+            # which it would truncate away, collapsing different cells
+            # into one key — contributes its exact hash as the cache
+            # namespace instead, so answers never cross cells
+            namespace = hashlib.sha256(
+                f"{system_prompt or ''}\x00{context}".encode("utf-8")
+            ).hexdigest()
+            response, cache_hit = self._cache.get_or_generate(
+                question, call_llm, namespace=namespace
+            )
+        else:
+            response = call_llm()
+            cache_hit = False
+
+        needle_found = expected_answer in response
+
+        result = {
+            "needle": needle,
+            "question": question,
+            "context_size": context_size,
+            "depth_percent": depth_percent,
+            "needle_found": needle_found,
+            "response": response,
+            "cache_hit": cache_hit,
+            "cache_hits": self.cache_hits,
+        }
+
+        logger.info(
+            "Long-context test: size=%d depth=%.0f%% found=%s cached=%s",
+            context_size, depth_percent, needle_found, cache_hit,
+        )
+
+        return result
+
+    def run_multiple_tests(
+        self,
+        needle: str,
+        context_sizes: List[int],
+        depth_percents: Optional[List[float]] = None,
+        trials_per_config: int = 1,
+        question: Optional[str] = None,
+        expected_answer: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run the full context-size × depth × trials matrix
+
+        The context for a given (size, depth) cell is deterministic, so
+        with the semantic cache enabled every trial after the first in
+        a cell is answered from the cache — for a 5×5×3 matrix roughly
+        two thirds of the LLM calls never leave the process.
+
+        Args:
+            needle: Needle sentence containing the target information
+            context_sizes: Context lengths to test
+            depth_percents: Needle depth percentages (default
+                [0, 25, 50, 75, 100])
+            trials_per_config: Number of trials per (size, depth) cell
+            question: Question posed to the LLM (defaults to the needle)
+            expected_answer: Substring the response must contain
+            system_prompt: Optional system prompt forwarded to the LLM
+
+        Returns:
+            List of result dictionaries (one per trial)
+        """
+        if depth_percents is None:
+            depth_percents = [0, 25, 50, 75, 100]
+
+        results = []
+        for size in context_sizes:
+            for depth in depth_percents:
+                for trial in range(trials_per_config):
+                    result = self.run_test(
+                        needle=needle,
+                        context_size=size,
+                        depth_percent=depth,
+                        question=question,
+                        expected_answer=expected_answer,
+                        system_prompt=system_prompt,
+                    )
+                    result["trial"] = trial
+                    results.append(result)
+
+        return results
@@ -82,7 +82,12 @@ class RealTimeFeishuRAG:
             self.rag_client.reset()
             logger.info("Vector store cleared")
 
-            # Add documents to vector store
+            # Add all documents in one batch: a single batched encode
+            # amortizes tokenizer/model dispatch across documents instead
+            # of paying a full encode call per document
+            contents = []
+            metadatas = []
+            doc_ids = []
             for doc in documents:
                 metadata = {
                     "source": "feishu",
@@ -92,12 +97,17 @@ class RealTimeFeishuRAG:
                 }
                 metadata.update(doc.metadata or {})
 
-                self.rag_client.add_document(
-                    content=doc.content,
-                    metadata=metadata,
-                    doc_id=doc.doc_id,
-                )
+                contents.append(doc.content)
+                metadatas.append(metadata)
+                doc_ids.append(doc.doc_id)
 
+            self.rag_client.add_documents(
+                documents=contents,
+                metadatas=metadatas,
+                doc_ids=doc_ids,
+            )
+
+            for doc in documents:
                 logger.info(f"Added document: {doc.title} ({len(doc.content)} bytes)")
 
             # Update timestamp
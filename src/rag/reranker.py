@@ -1,9 +1,21 @@
 """Reranker for improving retrieval accuracy"""
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import FrozenSet, List, Dict, Any
 from .types import SearchResult
 
 
+@lru_cache(maxsize=128)
+def _query_chars(query: str) -> FrozenSet[str]:
+    """Normalized character set of a query, memoized across calls
+
+    The same query string is scored against every candidate (and often
+    re-scored across requests); building its character set once per
+    distinct query removes the per-result set construction.
+    """
+    return frozenset(query.replace(" ", ""))
+
+
 class Reranker:
     """Simple reranker based on keyword matching and semantic similarity"""
 
@@ -40,6 +52,32 @@ class Reranker:
 
         return scored_results[:top_k]
 
+    def rerank_batch(
+        self,
+        queries: List[str],
+        results_lists: List[List[SearchResult]],
+        top_k: int = 5
+    ) -> List[List[SearchResult]]:
+        """Rerank result lists for several queries
+
+        The scoring here is lightweight Python (no model call), so this
+        is a straight loop; the batch signature mirrors
+        RAGClient.search_batch and gives model-backed rerankers a single
+        place to score all (query, passage) pairs in one batch.
+
+        Args:
+            queries: Original queries
+            results_lists: One result list per query
+            top_k: Number of top results to keep per query
+
+        Returns:
+            Reranked result lists, in query order
+        """
+        return [
+            self.rerank(query, results, top_k=top_k)
+            for query, results in zip(queries, results_lists)
+        ]
+
     def _calculate_relevance_score(
         self,
         query: str,
@@ -80,8 +118,9 @@ class Reranker:
         Returns:
             Overlap score (0-1)
         """
-        # Simple character-level overlap for Chinese
-        query_chars = set(query.replace(" ", ""))
+        # Simple character-level overlap for Chinese; the query's
+        # character set is memoized since it repeats per candidate
+        query_chars = _query_chars(query)
         content_chars = set(content.replace(" ", ""))
 
         if not query_chars:
@@ -1,6 +1,7 @@
 """Vector store implementations"""
 
 from .chromadb_store import ChromaDBStore
+from .numpy_store import NumPyStore
 from .factory import create_vector_store
 
-__all__ = ["ChromaDBStore", "create_vector_store"]
+__all__ = ["ChromaDBStore", "NumPyStore", "create_vector_store"]
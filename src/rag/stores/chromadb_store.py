@@ -1,9 +1,11 @@
 """ChromaDB vector store implementation"""
 
 import os
+import threading
 import uuid
 from typing import List, Dict, Any, Optional
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 
 from ..core.vector_store import BaseVectorStore
@@ -22,16 +24,47 @@ class ChromaDBStore(BaseVectorStore):
         persist_directory: str = "./chroma_db",
         collection_name: str = "documents",
         allow_reset: bool = True,
+        hnsw_m: int = 24,
+        hnsw_ef_construction: int = 128,
+        hnsw_ef_search: int = 100,
+        commit_batch_size: int = 0,
     ):
         """Initialize ChromaDB vector store
 
+        HNSW parameters default above ChromaDB's own defaults (m=16,
+        ef_construction=100, ef_search=10), which give poor recall on
+        persistent collections beyond ~10k vectors. They only take
+        effect at collection creation; an existing collection keeps
+        the parameters it was built with.
+
         Args:
             persist_directory: Directory for persistent storage
             collection_name: Name of the collection
             allow_reset: Whether to allow resetting the database
+            hnsw_m: Number of graph neighbors per node
+            hnsw_ef_construction: Candidate list size while building the index
+            hnsw_ef_search: Candidate list size at query time
+            commit_batch_size: Buffer this many documents before
+                committing them to ChromaDB in one call, amortizing the
+                SQLite transaction across the batch. Reads flush the
+                buffer transparently; call flush() at ingest end.
+                0 commits every add_documents call immediately
+
+        Raises:
+            ValueError: If commit_batch_size is negative
         """
+        if commit_batch_size < 0:
+            raise ValueError(
+                f"commit_batch_size must be >= 0, got {commit_batch_size}"
+            )
         self._persist_directory = persist_directory
         self._collection_name = collection_name
+        self._collection_metadata = {
+            "hnsw:space": "cosine",
+            "hnsw:M": hnsw_m,
+            "hnsw:construction_ef": hnsw_ef_construction,
+            "hnsw:search_ef": hnsw_ef_search,
+        }
 
         # Create persist directory if it doesn't exist
         os.makedirs(persist_directory, exist_ok=True)
@@ -48,9 +81,26 @@ class ChromaDBStore(BaseVectorStore):
         # Get or create collection
         self._collection = self._client.get_or_create_collection(
             name=collection_name,
-            metadata={"hnsw:space": "cosine"}  # Use cosine similarity
+            metadata=self._collection_metadata
         )
 
+        # Document count memo: collection.count() is a round-trip into
+        # Chroma's SQLite on every call, so keep the number locally and
+        # maintain it on writes. None means "not loaded yet".
+        self._cached_count: Optional[int] = None
+
+        # Write-behind buffer (parallel lists) for commit batching.
+        # RAGClient shards ingestion across a thread pool, so buffer
+        # mutation and flushing are guarded by a lock: interleaved
+        # extends would misalign ids against embeddings, and concurrent
+        # flushes could commit the same rows twice
+        self._commit_batch_size = commit_batch_size
+        self._buffer_lock = threading.Lock()
+        self._pending_ids: List[str] = []
+        self._pending_embeddings: List[List[float]] = []
+        self._pending_documents: List[str] = []
+        self._pending_metadatas: List[Optional[Dict[str, Any]]] = []
+
     def add_documents(
         self,
         documents: List[str],
@@ -81,14 +131,138 @@ class ChromaDBStore(BaseVectorStore):
         if ids is None:
             ids = [str(uuid.uuid4()) for _ in documents]
 
-        # Add to ChromaDB
-        self._collection.add(
+        # Materialize Python lists only here at the ChromaDB boundary;
+        # upstream the vectors travel as one contiguous float32 block
+        if hasattr(embeddings, "tolist"):
+            embeddings = embeddings.tolist()
+
+        if self._commit_batch_size > 0:
+            # Write-behind: buffer until the batch fills, so many small
+            # add_documents calls share one SQLite transaction. The four
+            # extends happen atomically under the lock so concurrent
+            # callers cannot interleave rows across the parallel lists
+            with self._buffer_lock:
+                self._pending_ids.extend(ids)
+                self._pending_embeddings.extend(embeddings)
+                self._pending_documents.extend(documents)
+                self._pending_metadatas.extend(
+                    metadatas if metadatas is not None else [None] * len(ids)
+                )
+                # add() rejects duplicate IDs, so every record is new
+                if self._cached_count is not None:
+                    self._cached_count += len(ids)
+                batch_full = len(self._pending_ids) >= self._commit_batch_size
+            if batch_full:
+                self.flush()
+        else:
+            # Add to ChromaDB
+            self._collection.add(
+                ids=ids,
+                embeddings=embeddings,
+                documents=documents,
+                metadatas=metadatas
+            )
+            if self._cached_count is not None:
+                self._cached_count += len(ids)
+
+        return ids
+
+    def flush(self) -> None:
+        """Commit any buffered documents to ChromaDB
+
+        No-op when the buffer is empty. Reads (search, info, deletes)
+        call this automatically so write-behind batching never serves
+        stale results; call it explicitly at the end of an ingest run.
+
+        Chroma rejects None entries inside a metadata list, so the
+        buffer is committed in runs of consecutive rows that all have
+        (or all lack) metadata — still one add per run instead of one
+        per document. Rows are dropped from the buffer only once their
+        run has committed, so a failing commit leaves the uncommitted
+        remainder buffered for retry.
+        """
+        with self._buffer_lock:
+            committed = 0
+            try:
+                while committed < len(self._pending_ids):
+                    start = committed
+                    has_metadata = self._pending_metadatas[start] is not None
+                    end = start + 1
+                    while (
+                        end < len(self._pending_ids)
+                        and (self._pending_metadatas[end] is not None) == has_metadata
+                    ):
+                        end += 1
+                    self._collection.add(
+                        ids=self._pending_ids[start:end],
+                        embeddings=self._pending_embeddings[start:end],
+                        documents=self._pending_documents[start:end],
+                        metadatas=(
+                            self._pending_metadatas[start:end]
+                            if has_metadata
+                            else None
+                        ),
+                    )
+                    committed = end
+            finally:
+                if committed:
+                    del self._pending_ids[:committed]
+                    del self._pending_embeddings[:committed]
+                    del self._pending_documents[:committed]
+                    del self._pending_metadatas[:committed]
+
+    def bulk_upsert(
+        self,
+        documents: List[str],
+        embeddings: List[List[float]],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Insert or update documents in a single upsert call
+
+        All records land in one ChromaDB transaction, amortizing the
+        SQLite commit and index update across the whole batch instead of
+        paying it per document. Existing IDs are overwritten rather than
+        raising, which makes re-ingestion of a persisted collection safe.
+
+        Args:
+            documents: List of document contents
+            embeddings: List of embedding vectors
+            metadatas: Optional list of metadata dicts
+            ids: Optional list of document IDs
+
+        Returns:
+            List of document IDs
+
+        Raises:
+            ValueError: If documents and embeddings lengths don't match
+        """
+        if len(documents) != len(embeddings):
+            raise ValueError(
+                f"Documents ({len(documents)}) and embeddings ({len(embeddings)}) must have the same length"
+            )
+
+        # An upsert may target IDs still sitting in the write-behind
+        # buffer; land those first so last-write-wins order holds
+        self.flush()
+
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in documents]
+
+        if hasattr(embeddings, "tolist"):
+            embeddings = embeddings.tolist()
+
+        self._collection.upsert(
             ids=ids,
             embeddings=embeddings,
             documents=documents,
             metadatas=metadatas
         )
 
+        # An upsert may overwrite existing IDs, so the net growth is
+        # unknown without a lookup; reload the count lazily instead
+        self._cached_count = None
+
         return ids
 
     def search(
@@ -112,9 +286,14 @@ class ChromaDBStore(BaseVectorStore):
         Raises:
             ValueError: If query_embedding is invalid
         """
-        if not query_embedding:
+        # Length check instead of truthiness: ndarray queries raise on
+        # bool() and a valid vector can hold zeros
+        if query_embedding is None or len(query_embedding) == 0:
             raise ValueError("Query embedding cannot be empty")
 
+        # Buffered documents must be searchable
+        self.flush()
+
         # Query ChromaDB
         results = self._collection.query(
             query_embeddings=[query_embedding],
@@ -123,25 +302,49 @@ class ChromaDBStore(BaseVectorStore):
         )
 
         # Format results
-        search_results: List[SearchResult] = []
-
-        if results["ids"] and len(results["ids"]) > 0:
-            for i in range(len(results["ids"][0])):
-                # Calculate similarity score (ChromaDB returns distance, convert to similarity)
-                distance = results["distances"][0][i] if results["distances"] else 0
-                score = 1 - distance  # Convert distance to similarity score
-
-                # Apply threshold if specified
-                if score_threshold is not None and score < score_threshold:
-                    continue
-
-                result: SearchResult = {
-                    "doc_id": results["ids"][0][i],
-                    "content": results["documents"][0][i],
-                    "metadata": results["metadatas"][0][i] if results["metadatas"] and results["metadatas"][0] else None,
-                    "score": score
+        if not results["ids"] or not results["ids"][0]:
+            return []
+
+        ids = results["ids"][0]
+        documents = results["documents"][0]
+        metadatas = (
+            results["metadatas"][0]
+            if results["metadatas"] and results["metadatas"][0]
+            else [None] * len(ids)
+        )
+        distances = (
+            results["distances"][0] if results["distances"] else [0] * len(ids)
+        )
+
+        # One vectorized distance-to-similarity conversion instead of
+        # per-row scalar arithmetic and repeated nested-list indexing
+        scores = 1.0 - np.asarray(distances, dtype=np.float32)
+
+        if score_threshold is not None:
+            # Vectorized threshold mask: the comparison runs once over
+            # the whole score array instead of per row in the interpreter
+            keep = np.flatnonzero(scores >= score_threshold)
+            return [
+                {
+                    "doc_id": ids[i],
+                    "content": documents[i],
+                    "metadata": metadatas[i],
+                    "score": float(scores[i]),
                 }
-                search_results.append(result)
+                for i in keep
+            ]
+
+        search_results: List[SearchResult] = [
+            {
+                "doc_id": doc_id,
+                "content": content,
+                "metadata": metadata,
+                "score": score,
+            }
+            for doc_id, content, metadata, score in zip(
+                ids, documents, metadatas, scores.tolist()
+            )
+        ]
 
         return search_results
 
@@ -152,7 +355,11 @@ class ChromaDBStore(BaseVectorStore):
             ids: List of document IDs to delete
         """
         if ids:
+            self.flush()
             self._collection.delete(ids=ids)
+            # Some of the IDs may not have existed, so decrementing by
+            # len(ids) could drift; reload the count lazily instead
+            self._cached_count = None
 
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the current collection
@@ -160,21 +367,27 @@ class ChromaDBStore(BaseVectorStore):
         Returns:
             Dictionary with collection metadata
         """
-        count = self._collection.count()
         return {
             "name": self._collection_name,
-            "count": count,
+            "count": self.document_count,
             "persist_directory": self._persist_directory,
         }
 
     def reset(self) -> None:
         """Clear all documents from the store"""
+        # Buffered documents are being discarded anyway
+        with self._buffer_lock:
+            self._pending_ids = []
+            self._pending_embeddings = []
+            self._pending_documents = []
+            self._pending_metadatas = []
         # Delete the collection and recreate it
         self._client.delete_collection(self._collection_name)
         self._collection = self._client.get_or_create_collection(
             name=self._collection_name,
-            metadata={"hnsw:space": "cosine"}
+            metadata=self._collection_metadata
         )
+        self._cached_count = 0
 
     @property
     def collection_name(self) -> str:
@@ -183,9 +396,17 @@ class ChromaDBStore(BaseVectorStore):
 
     @property
     def document_count(self) -> int:
-        """Get the number of documents in the collection"""
-        return self._collection.count()
+        """Get the number of documents in the collection
+
+        Served from the local memo; the backend is only queried once
+        after startup or after a write whose net effect is unknown.
+        """
+        if self._cached_count is None:
+            self.flush()
+            self._cached_count = self._collection.count()
+        return self._cached_count
 
     def delete_collection(self) -> None:
         """Delete the entire collection"""
+        self.flush()
         self._client.delete_collection(self._collection_name)
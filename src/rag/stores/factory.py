@@ -4,11 +4,12 @@ from typing import Literal
 from ..core.vector_store import BaseVectorStore
 from ..config import VectorStoreConfig
 from .chromadb_store import ChromaDBStore
+from .numpy_store import NumPyStore
 
 
 def create_vector_store(
     config: VectorStoreConfig | None = None,
-    provider: Literal["chromadb"] | None = None,
+    provider: Literal["chromadb", "memory", "faiss"] | None = None,
     **kwargs
 ) -> BaseVectorStore:
     """Factory function to create vector store instances
@@ -44,6 +45,27 @@ def create_vector_store(
             persist_directory=config.persist_directory,
             collection_name=config.collection_name,
             allow_reset=config.allow_reset,
+            hnsw_m=config.hnsw_m,
+            hnsw_ef_construction=config.hnsw_ef_construction,
+            hnsw_ef_search=config.hnsw_ef_search,
+            commit_batch_size=config.commit_batch_size,
+        )
+    elif config.provider == "memory":
+        return NumPyStore(
+            collection_name=config.collection_name,
+            quantization=config.quantization,
+        )
+    elif config.provider == "faiss":
+        # Imported lazily: faiss-cpu is an optional dependency
+        from .faiss_store import FaissStore
+        if config.dimension is None:
+            raise ValueError(
+                "faiss provider requires VectorStoreConfig.dimension "
+                "(FAISS indexes are built for a fixed embedding dimension)"
+            )
+        return FaissStore(
+            dimension=config.dimension,
+            collection_name=config.collection_name,
         )
     # Future: Add support for Qdrant, Weaviate, etc.
     # elif config.provider == "qdrant":
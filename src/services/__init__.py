@@ -1,6 +1,7 @@
 """服务模块"""
 
 from .conversation_manager import ConversationManager
+from .perf_tracker import PerfTracker
 from .rag_chat_service import RAGChatService
 
-__all__ = ["ConversationManager", "RAGChatService"]
+__all__ = ["ConversationManager", "PerfTracker", "RAGChatService"]
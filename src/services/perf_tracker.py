@@ -0,0 +1,70 @@
+"""性能计时器 - 按阶段记录耗时并提供分位数统计"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator
+
+
+class PerfTracker:
+    """按阶段（embed/search/llm 等）记录耗时的滚动窗口计时器
+
+    每个阶段维护一个固定长度的样本窗口，统计时给出 p50/p99
+    分位数，用于定位请求链路中的热点阶段。
+
+    Examples:
+        >>> perf = PerfTracker()
+        >>> with perf.timeit("search"):
+        ...     results = client.search(query)
+        >>> perf.summary()
+        {'search_p50_ms': 12.3, 'search_p99_ms': 45.6, 'search_count': 1}
+    """
+
+    def __init__(self, window: int = 1024):
+        """
+        初始化计时器
+
+        Args:
+            window: 每个阶段保留的样本数（滚动窗口）
+        """
+        self._window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    @contextmanager
+    def timeit(self, stage: str) -> Iterator[None]:
+        """
+        计时上下文管理器 - 记录代码块耗时到指定阶段
+
+        Args:
+            stage: 阶段名称，如 "embed"、"search"、"llm"
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter_ns() - start) / 1e6
+            if stage not in self._samples:
+                self._samples[stage] = deque(maxlen=self._window)
+            self._samples[stage].append(elapsed_ms)
+
+    @staticmethod
+    def _percentile(sorted_values: list, q: float) -> float:
+        """取已排序样本的 q 分位数（最近邻法）"""
+        index = min(len(sorted_values) - 1, round(q * (len(sorted_values) - 1)))
+        return sorted_values[index]
+
+    def summary(self) -> Dict[str, float]:
+        """
+        汇总各阶段的分位数统计
+
+        Returns:
+            形如 {"embed_p50_ms": ..., "embed_p99_ms": ..., "embed_count": ...}
+            的统计字典
+        """
+        stats: Dict[str, float] = {}
+        for stage, samples in self._samples.items():
+            values = sorted(samples)
+            stats[f"{stage}_p50_ms"] = round(self._percentile(values, 0.50), 2)
+            stats[f"{stage}_p99_ms"] = round(self._percentile(values, 0.99), 2)
+            stats[f"{stage}_count"] = len(values)
+        return stats
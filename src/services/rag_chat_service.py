@@ -1,11 +1,18 @@
 """RAG + 多轮对话服务 - 整合 RAG、LLM、历史管理"""
 
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Iterator, List, Optional, Dict, Any
 
 from src.rag.client import RAGClient
 from src.llm.factory import LLMFactory
 from .conversation_manager import ConversationManager
+from .perf_tracker import PerfTracker
 
 logger = logging.getLogger(__name__)
 
@@ -38,23 +45,117 @@ class RAGChatService:
         if data_directory:
             self._load_documents(data_directory)
 
-        # 初始化 LLM 客户端
-        self.llm = LLMFactory.create(
-            provider=llm_provider,
-            api_key=llm_api_key,
-            model=llm_model,
-        )
+        # LLM 客户端延迟创建（见 llm 属性），只做检索的场景不付初始化成本
+        self._llm_provider = llm_provider
+        self._llm_api_key = llm_api_key
+        self._llm_model = llm_model
 
         # 初始化历史管理
         self.conversation_mgr = ConversationManager(base_dir=history_dir)
 
+        # 查询 embedding 缓存（LRU）- 重复查询跳过 embedding 前向计算。
+        # API 层在多线程 executor 上并发进来，读改写需加锁
+        self._query_cache: OrderedDict[str, List[float]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_maxsize = 4096
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+
+        # 各阶段耗时统计（embed/search/llm），通过 /stats 暴露分位数
+        self._perf = PerfTracker()
+
+        # 小线程池：历史加载等磁盘 IO 与检索计算重叠执行
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="rag-io"
+        )
+
         logger.info("✅ RAGChatService 初始化完成")
 
+    @cached_property
+    def llm(self):
+        """LLM 客户端 - 首次访问时创建"""
+        return LLMFactory.create(
+            provider=self._llm_provider,
+            api_key=self._llm_api_key,
+            model=self._llm_model,
+        )
+
+    def _embed_query_cached(self, query: str) -> List[float]:
+        """计算查询 embedding，命中缓存时直接返回缓存向量
+
+        Args:
+            query: 用户查询文本
+
+        Returns:
+            查询的 embedding 向量
+        """
+        key = hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+        with self._query_cache_lock:
+            if key in self._query_cache:
+                self._query_cache.move_to_end(key)
+                self._query_cache_hits += 1
+                return self._query_cache[key]
+            self._query_cache_misses += 1
+
+        # 编码在锁外进行：前向计算可能上百毫秒，不应串行化其他查询；
+        # 两个线程偶尔对同一新查询各算一次，结果相同，无碍
+        embedding = self.rag_client.embedding.encode(query)
+
+        with self._query_cache_lock:
+            self._query_cache[key] = embedding
+            if len(self._query_cache) > self._query_cache_maxsize:
+                self._query_cache.popitem(last=False)
+
+        return embedding
+
+    def _compute_ingest_fingerprint(self, data_directory: str) -> str:
+        """计算数据目录的指纹（文件路径 + mtime + 大小）
+
+        Args:
+            data_directory: 数据目录
+
+        Returns:
+            指纹哈希；目录不存在时返回空字符串
+        """
+        directory = Path(data_directory)
+        if not directory.is_dir():
+            return ""
+
+        # 非递归 glob：LocalFileLoader 只扫目录顶层，指纹必须覆盖
+        # 完全相同的文件集合，否则子目录的变动会触发无谓的全量重嵌入
+        entries = sorted(
+            (str(path), path.stat().st_mtime_ns, path.stat().st_size)
+            for pattern in ("*.txt", "*.md")
+            for path in directory.glob(pattern)
+        )
+        return hashlib.sha256(repr(entries).encode("utf-8")).hexdigest()
+
+    def _fingerprint_path(self) -> Path:
+        """指纹文件位置（与向量库同目录，随库一起失效/删除）"""
+        persist_dir = self.rag_client.config.vector_store.persist_directory
+        return Path(persist_dir) / ".ingest_fingerprint"
+
     def _load_documents(self, data_directory: str) -> None:
-        """从目录加载文档"""
+        """从目录加载文档（目录未变化且库非空时直接复用持久化向量库）"""
         from src.data.loaders import LocalFileLoader
 
-        logger.info(f"从 {data_directory} 加载文档...")
+        # 指纹匹配 → 语料未变，跳过整个加载 + 嵌入流程
+        fingerprint = self._compute_ingest_fingerprint(data_directory)
+        fp_path = self._fingerprint_path()
+        try:
+            if (
+                fingerprint
+                and fp_path.is_file()
+                and fp_path.read_text(encoding="utf-8") == fingerprint
+                and self.rag_client.document_count > 0
+            ):
+                logger.info("✅ 数据目录未变化，复用已持久化的向量库")
+                return
+        except OSError:
+            pass
+
+        logger.info("从 %s 加载文档...", data_directory)
 
         # 加载 .txt 文件
         loader_txt = LocalFileLoader(directory=data_directory, file_pattern="*.txt")
@@ -67,17 +168,31 @@ class RAGChatService:
         documents = documents_txt + documents_md
 
         if documents:
-            for doc in documents:
-                self.rag_client.add_document(
-                    content=doc.content,
-                    metadata={
+            # 单次批量调用：embedding 模型对全部文档做一次向量化前向，
+            # 而不是每个文档一次前向
+            self.rag_client.add_documents(
+                documents=[doc.content for doc in documents],
+                metadatas=[
+                    {
                         "source": doc.source,
                         "title": doc.title or "Untitled",
                         "doc_id": doc.doc_id,
-                    },
-                    doc_id=doc.doc_id,
-                )
-            logger.info(f"✅ 加载了 {len(documents)} 个文档")
+                    }
+                    for doc in documents
+                ],
+                doc_ids=[doc.doc_id for doc in documents],
+                # 持久化库重启重载时覆盖同 ID 记录而不是报错
+                upsert=True,
+            )
+            logger.info("✅ 加载了 %d 个文档", len(documents))
+
+            # 记录指纹，下次启动语料未变时跳过嵌入
+            if fingerprint:
+                try:
+                    fp_path.parent.mkdir(parents=True, exist_ok=True)
+                    fp_path.write_text(fingerprint, encoding="utf-8")
+                except OSError as e:
+                    logger.warning("写入指纹文件失败: %s", e)
         else:
             logger.warning("⚠️  未加载任何文档")
 
@@ -145,18 +260,33 @@ class RAGChatService:
         Returns:
             LLM 的回复
         """
-        logger.info(f"[{platform}/{user_id}] 收到消息: {message[:50]}...")
+        logger.info("[%s/%s] 收到消息: %s...", platform, user_id, message[:50])
 
         # 调试模式
         if debug:
             self.debug_search(message, limit=search_limit)
 
+        # 对话历史在后台线程加载，与检索（embedding + 向量搜索）重叠
+        history_future = None
+        if use_history:
+            history_future = self._io_executor.submit(
+                self.conversation_mgr.get_latest_messages,
+                platform, user_id, 5,
+            )
+
         # 1. RAG 搜索相关文档
         try:
             # 确保文本编码正确
             if isinstance(message, bytes):
                 message = message.decode('utf-8')
-            search_results = self.rag_client.search(message, limit=search_limit)
+            with self._perf.timeit("embed"):
+                query_embedding = self._embed_query_cached(message)
+            with self._perf.timeit("search"):
+                search_results = self.rag_client.search(
+                    message,
+                    limit=search_limit,
+                    query_embedding=query_embedding,
+                )
             context = [result["content"] for result in search_results]
 
             # 输出调试信息
@@ -168,41 +298,146 @@ class RAGChatService:
                     print(f"  - 平均相似度: {avg_score:.4f}")
                 print()
         except Exception as e:
-            logger.warning(f"搜索失败: {e}")
+            logger.warning("搜索失败: %s", e)
             context = []
 
         if not context:
-            logger.warning(f"未找到相关文档")
+            logger.warning("未找到相关文档")
             context = ["（未找到相关文档）"]
 
-        # 2. 加载对话历史
+        # 2. 取回后台加载的对话历史
         history = []
+        if history_future is not None:
+            history = history_future.result()
+            logger.info("加载 %d 条历史记录", len(history))
+
+        # 3. 调用 LLM 生成回答
+        try:
+            with self._perf.timeit("llm"):
+                if history:
+                    # 有历史 - 使用多轮对话
+                    reply = self.llm.generate_with_history(
+                        query=message,
+                        context=context,
+                        history=history,
+                    )
+                else:
+                    # 无历史 - 单轮对话
+                    reply = self.llm.generate(
+                        query=message,
+                        context=context,
+                    )
+
+            logger.info("✅ 生成回答: %s...", reply[:50])
+        except Exception as e:
+            logger.error("LLM 调用失败: %s", e)
+            reply = f"抱歉，生成回答时出现错误: {str(e)}"
+
+        # 4. 保存到历史
+        try:
+            self.conversation_mgr.add_message(
+                platform=platform,
+                user_id=user_id,
+                role="user",
+                content=message,
+            )
+            self.conversation_mgr.add_message(
+                platform=platform,
+                user_id=user_id,
+                role="assistant",
+                content=reply,
+            )
+            logger.info("✅ 历史已保存")
+        except Exception as e:
+            logger.error("保存历史失败: %s", e)
+
+        return reply
+
+    def chat_stream(
+        self,
+        platform: str,
+        user_id: str,
+        user_name: str,
+        message: str,
+        use_history: bool = True,
+        search_limit: int = 3,
+    ) -> Iterator[str]:
+        """
+        处理用户消息，流式产出回复片段
+
+        流程与 chat() 相同（搜索 → 历史 → LLM → 保存），但 LLM
+        回答按增量 yield，首 token 即可返回给调用方；完整回复在
+        生成结束后写入历史。
+
+        Args:
+            platform: 平台名称 (bilibili, weibo, etc.)
+            user_id: 用户 ID
+            user_name: 用户名
+            message: 用户消息
+            use_history: 是否使用对话历史
+            search_limit: 搜索结果限制
+
+        Yields:
+            回复的增量片段
+        """
+        logger.info("[%s/%s] 收到流式请求: %s...", platform, user_id, message[:50])
+
+        # 对话历史在后台线程加载，与检索重叠
+        history_future = None
         if use_history:
-            history = self.conversation_mgr.get_latest_messages(
-                platform, user_id, limit=5
+            history_future = self._io_executor.submit(
+                self.conversation_mgr.get_latest_messages,
+                platform, user_id, 5,
             )
-            logger.info(f"加载 {len(history)} 条历史记录")
 
-        # 3. 调用 LLM 生成回答
+        # 1. RAG 搜索相关文档
+        try:
+            if isinstance(message, bytes):
+                message = message.decode('utf-8')
+            search_results = self.rag_client.search(
+                message,
+                limit=search_limit,
+                query_embedding=self._embed_query_cached(message),
+            )
+            context = [result["content"] for result in search_results]
+        except Exception as e:
+            logger.warning("搜索失败: %s", e)
+            context = []
+
+        if not context:
+            context = ["（未找到相关文档）"]
+
+        # 2. 取回后台加载的对话历史
+        history = []
+        if history_future is not None:
+            history = history_future.result()
+
+        # 3. 流式调用 LLM，边生成边产出
+        parts: List[str] = []
         try:
             if history:
-                # 有历史 - 使用多轮对话
-                reply = self.llm.generate_with_history(
+                stream = self.llm.generate_stream_with_history(
                     query=message,
                     context=context,
                     history=history,
                 )
             else:
-                # 无历史 - 单轮对话
-                reply = self.llm.generate(
+                stream = self.llm.generate_stream(
                     query=message,
                     context=context,
                 )
 
-            logger.info(f"✅ 生成回答: {reply[:50]}...")
+            for chunk in stream:
+                if chunk:
+                    parts.append(chunk)
+                    yield chunk
         except Exception as e:
-            logger.error(f"LLM 调用失败: {e}")
-            reply = f"抱歉，生成回答时出现错误: {str(e)}"
+            logger.error("LLM 流式调用失败: %s", e)
+            error_msg = f"抱歉，生成回答时出现错误: {str(e)}"
+            parts.append(error_msg)
+            yield error_msg
+
+        reply = "".join(parts)
 
         # 4. 保存到历史
         try:
@@ -218,11 +453,8 @@ class RAGChatService:
                 role="assistant",
                 content=reply,
             )
-            logger.info(f"✅ 历史已保存")
         except Exception as e:
-            logger.error(f"保存历史失败: {e}")
-
-        return reply
+            logger.error("保存历史失败: %s", e)
 
     def get_stats(self) -> Dict[str, Any]:
         """获取服务统计信息"""
@@ -231,9 +463,13 @@ class RAGChatService:
             **rag_stats,
             "llm_provider": self.llm.__class__.__name__,
             "service": "RAGChatService",
+            "query_cache_hits": self._query_cache_hits,
+            "query_cache_misses": self._query_cache_misses,
+            "query_cache_size": len(self._query_cache),
+            "perf": self._perf.summary(),
         }
 
     def clear_user_history(self, platform: str, user_id: str) -> None:
         """清空用户的对话历史"""
         self.conversation_mgr.clear_history(platform, user_id)
-        logger.info(f"已清空 {platform}/{user_id} 的对话历史")
+        logger.info("已清空 %s/%s 的对话历史", platform, user_id)
@@ -3,6 +3,7 @@
 import pytest
 import tempfile
 import os
+from pathlib import Path
 from src.rag.document_loader import DocumentLoader
 
 
@@ -122,3 +123,156 @@ class TestChineseTextProcessing:
         # All chunks should contain Chinese characters
         combined = "".join(chunks)
         assert any('\u4e00' <= char <= '\u9fff' for char in combined)
+
+
+@pytest.fixture
+def make_text_file(tmp_path):
+    """Factory writing UTF-8 content to a temp file"""
+    counter = {"n": 0}
+
+    def _make(content: str) -> str:
+        counter["n"] += 1
+        path = tmp_path / f"doc_{counter['n']}.txt"
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    return _make
+
+
+class TestSplitLongText:
+    """Test sentence-boundary splitting of unbroken text"""
+
+    @pytest.fixture(autouse=True)
+    def force_python_fallback(self, monkeypatch):
+        """Exercise the pure-Python scan regardless of numba"""
+        monkeypatch.setattr(
+            "src.rag.document_loader._HAS_NUMBA", False
+        )
+
+    def test_cuts_at_sentence_boundary(self):
+        loader = DocumentLoader()
+        text = "前面一句。" * 30
+        chunks = loader._split_long_text(text, chunk_size=25)
+
+        assert all(chunk.endswith("。") for chunk in chunks)
+        assert "".join(chunks) == text
+
+    def test_no_boundary_falls_back_to_hard_cut(self):
+        loader = DocumentLoader()
+        text = "字" * 100
+        chunks = loader._split_long_text(text, chunk_size=30)
+
+        assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+
+    def test_cut_uses_last_ender_in_window(self):
+        """The cut lands after the last ender inside the window"""
+        loader = DocumentLoader()
+        text = "x" * 10 + "。" + "y" * 14 + "。" + "z" * 100
+        chunks = loader._split_long_text(text, chunk_size=40)
+
+        # Both enders fall inside the first 40-char window; the later
+        # one wins, and the scan resumes from that boundary
+        assert chunks[0] == "x" * 10 + "。" + "y" * 14 + "。"
+        assert chunks[1] == "z" * 40
+
+    def test_ignores_boundary_below_min_chunk(self):
+        loader = DocumentLoader()
+        text = "短。" + "长" * 60
+        chunks = loader._split_long_text(text, chunk_size=40)
+
+        # The ender at position 1 is below chunk_size // 4, so the
+        # first cut is a hard cut at the window edge
+        assert len(chunks[0]) == 40
+
+
+class TestFixedSizeStreaming:
+    """Test the streaming chunker used for large fixed_size loads"""
+
+    def test_streaming_matches_in_memory_chunker(self, make_text_file):
+        loader = DocumentLoader()
+        content = ("这是一句话。废话连篇。\r\n" * 200 + "尾巴") * 3
+        path = make_text_file(content)
+
+        streamed = list(
+            loader._stream_fixed_size_chunks(Path(path), 120, 20)
+        )
+        in_memory = loader._chunk_by_fixed_size(
+            Path(path).read_text(encoding="utf-8"), 120, 20
+        )
+
+        assert streamed == in_memory
+
+    def test_large_file_routes_through_streaming(self, make_text_file):
+        loader = DocumentLoader()
+        # Above the mmap threshold (1 MiB) fixed_size streams the file
+        content = "正文内容。" * 80_000
+        path = make_text_file(content)
+        assert os.path.getsize(path) >= 1 << 20
+
+        chunks = loader.load_file(path, strategy="fixed_size",
+                                  chunk_size=300, overlap=50)
+        expected = loader._chunk_by_fixed_size(content, 300, 50)
+
+        assert chunks == expected
+
+    def test_invalid_overlap_raises(self, make_text_file):
+        loader = DocumentLoader()
+        path = make_text_file("内容")
+        with pytest.raises(ValueError):
+            list(loader._stream_fixed_size_chunks(Path(path), 10, 10))
+
+
+class TestLoadMultipleFiles:
+    """Test concurrent multi-file loading"""
+
+    def test_results_keep_file_order(self, make_text_file):
+        loader = DocumentLoader()
+        paths = [make_text_file(f"文件{i}的内容。") for i in range(5)]
+
+        chunks = loader.load_multiple_files(paths)
+
+        assert chunks == [f"文件{i}的内容。" for i in range(5)]
+
+    def test_process_executor(self, make_text_file):
+        loader = DocumentLoader()
+        paths = [make_text_file(f"文件{i}的内容。") for i in range(3)]
+
+        chunks = loader.load_multiple_files(paths, executor="process")
+
+        assert chunks == [f"文件{i}的内容。" for i in range(3)]
+
+    def test_unknown_executor_raises(self, make_text_file):
+        loader = DocumentLoader()
+        path = make_text_file("内容")
+        with pytest.raises(ValueError):
+            loader.load_multiple_files([path], executor="fiber")
+
+    def test_empty_input_returns_empty(self):
+        loader = DocumentLoader()
+        assert loader.load_multiple_files([]) == []
+
+
+class TestChunkCache:
+    """Test the per-file chunk cache"""
+
+    def test_repeat_load_returns_equal_chunks(self, make_text_file):
+        loader = DocumentLoader()
+        path = make_text_file("第一段。\n\n第二段。")
+
+        first = loader.load_file(path)
+        second = loader.load_file(path)
+
+        assert first == second
+        # Callers get independent lists, not the cached one
+        second.append("mutated")
+        assert loader.load_file(path) == first
+
+    def test_modified_file_invalidates_cache(self, make_text_file):
+        loader = DocumentLoader()
+        path = make_text_file("旧内容。")
+        loader.load_file(path)
+
+        Path(path).write_text("新内容。", encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+
+        assert loader.load_file(path) == ["新内容。"]
@@ -0,0 +1,115 @@
+"""Tests for the model2vec and TEI embedding providers (mocked backends)"""
+
+import sys
+import types
+
+import pytest
+from unittest.mock import Mock
+
+from src.rag.embeddings.tei import TEIEmbedding
+
+
+@pytest.fixture
+def fake_model2vec(monkeypatch):
+    """Install a fake model2vec package so the provider can be imported"""
+    fake_model = Mock()
+    fake_model.encode.side_effect = lambda texts: [
+        [float(len(text)), 0.5] for text in texts
+    ]
+
+    fake_module = types.ModuleType("model2vec")
+    fake_module.StaticModel = Mock()
+    fake_module.StaticModel.from_pretrained.return_value = fake_model
+    monkeypatch.setitem(sys.modules, "model2vec", fake_module)
+    return fake_module
+
+
+class TestModel2VecEmbedding:
+    """Test the static-embedding provider against a fake backend"""
+
+    def test_encode_single_text(self, fake_model2vec):
+        from src.rag.embeddings.model2vec import Model2VecEmbedding
+
+        embedding = Model2VecEmbedding(model_name="fake/model")
+        vector = embedding.encode("你好")
+
+        assert vector == [2.0, 0.5]
+        fake_model2vec.StaticModel.from_pretrained.assert_called_once_with(
+            "fake/model"
+        )
+
+    def test_encode_batch_of_texts(self, fake_model2vec):
+        from src.rag.embeddings.model2vec import Model2VecEmbedding
+
+        embedding = Model2VecEmbedding(model_name="fake/model")
+        vectors = embedding.encode(["一", "两个"])
+
+        assert vectors == [[1.0, 0.5], [2.0, 0.5]]
+
+    def test_dimension_cached_after_first_encode(self, fake_model2vec):
+        from src.rag.embeddings.model2vec import Model2VecEmbedding
+
+        embedding = Model2VecEmbedding(model_name="fake/model")
+        assert embedding.dimension == 2
+        assert embedding.model_name == "fake/model"
+
+    def test_missing_package_raises_import_error(self, monkeypatch):
+        from src.rag.embeddings.model2vec import Model2VecEmbedding
+
+        monkeypatch.setitem(sys.modules, "model2vec", None)
+        with pytest.raises(ImportError):
+            Model2VecEmbedding()
+
+
+def make_tei_embedding(payload=None, post_error=None, **kwargs):
+    """Build a TEIEmbedding whose HTTP session is a mock"""
+    embedding = TEIEmbedding(**kwargs)
+    session = Mock()
+    if post_error is not None:
+        session.post.side_effect = post_error
+    else:
+        response = Mock()
+        response.json.return_value = payload
+        session.post.return_value = response
+    embedding._session = session
+    return embedding
+
+
+class TestTEIEmbedding:
+    """Test the TEI sidecar client against a mocked session"""
+
+    def test_encode_single_text(self):
+        embedding = make_tei_embedding(
+            payload=[[0.1, 0.2]], base_url="http://tei:8080/"
+        )
+        vector = embedding.encode("你好")
+
+        assert vector == [0.1, 0.2]
+        args, kwargs = embedding._session.post.call_args
+        assert args[0] == "http://tei:8080/embed"
+        assert kwargs["json"] == {"inputs": ["你好"]}
+
+    def test_encode_batch_of_texts(self):
+        embedding = make_tei_embedding(payload=[[0.1, 0.2], [0.3, 0.4]])
+        vectors = embedding.encode(["一", "二"])
+
+        assert vectors == [[0.1, 0.2], [0.3, 0.4]]
+
+    def test_dimension_cached_after_first_encode(self):
+        embedding = make_tei_embedding(payload=[[0.1, 0.2, 0.3]])
+        embedding.encode("你好")
+
+        assert embedding.dimension == 3
+        # The cached dimension must not trigger a second request
+        assert embedding._session.post.call_count == 1
+
+    def test_server_failure_raises_runtime_error(self):
+        embedding = make_tei_embedding(post_error=ConnectionError("down"))
+        with pytest.raises(RuntimeError):
+            embedding.encode("你好")
+
+    def test_base_url_from_environment(self, monkeypatch):
+        monkeypatch.setenv("TEI_BASE_URL", "http://env-host:9090")
+        embedding = TEIEmbedding()
+
+        assert embedding._base_url == "http://env-host:9090"
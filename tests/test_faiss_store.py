@@ -0,0 +1,137 @@
+"""Tests for the FAISS vector store (skipped when faiss is not installed)"""
+
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from src.rag.config import VectorStoreConfig
+from src.rag.stores.factory import create_vector_store
+from src.rag.stores.faiss_store import FaissStore
+
+
+def make_store(**kwargs):
+    store = FaissStore(dimension=2, collection_name="test_collection", **kwargs)
+    store.add_documents(
+        documents=["东", "北", "东北"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]],
+        metadatas=[{"axis": "x"}, {"axis": "y"}, None],
+        ids=["east", "north", "northeast"],
+    )
+    return store
+
+
+class TestFaissStoreSearch:
+    """Test search behavior of the exact flat index"""
+
+    def test_search_orders_by_cosine_score(self):
+        store = make_store()
+        results = store.search([1.0, 0.1], limit=3)
+
+        assert [r["doc_id"] for r in results] == ["east", "northeast", "north"]
+        assert results[0]["score"] == pytest.approx(1.0, abs=0.01)
+
+    def test_search_score_threshold(self):
+        store = make_store()
+        results = store.search([1.0, 0.0], limit=3, score_threshold=0.9)
+
+        assert [r["doc_id"] for r in results] == ["east"]
+
+    def test_search_metadata_filter_over_fetches(self):
+        store = make_store()
+        # "north" is the worst match for this query; the filter must
+        # still surface it despite limit=1
+        results = store.search([1.0, 0.1], limit=1, filter_metadata={"axis": "y"})
+
+        assert [r["doc_id"] for r in results] == ["north"]
+
+    def test_search_empty_store_returns_empty(self):
+        store = FaissStore(dimension=2)
+        assert store.search([1.0, 0.0]) == []
+
+    def test_search_empty_query_raises(self):
+        store = make_store()
+        with pytest.raises(ValueError):
+            store.search([])
+
+    def test_search_batch_matches_single_search(self):
+        store = make_store()
+        queries = [[1.0, 0.0], [0.0, 1.0]]
+        batched = store.search_batch(queries, limit=3)
+        singles = [store.search(q, limit=3) for q in queries]
+
+        for batch_results, single_results in zip(batched, singles):
+            assert [r["doc_id"] for r in batch_results] == [
+                r["doc_id"] for r in single_results
+            ]
+
+
+class TestFaissStoreLifecycle:
+    """Test delete/rebuild and reset behavior"""
+
+    def test_delete_rebuilds_index(self):
+        store = make_store()
+        store.delete_documents(["east"])
+
+        assert store.document_count == 2
+        results = store.search([1.0, 0.1], limit=3)
+        assert [r["doc_id"] for r in results] == ["northeast", "north"]
+
+    def test_delete_all_documents(self):
+        store = make_store()
+        store.delete_documents(["east", "north", "northeast"])
+
+        assert store.document_count == 0
+        assert store.search([1.0, 0.0]) == []
+
+    def test_delete_unknown_ids_is_noop(self):
+        store = make_store()
+        store.delete_documents(["missing"])
+
+        assert store.document_count == 3
+
+    def test_reset(self):
+        store = make_store()
+        store.reset()
+
+        assert store.document_count == 0
+        assert store.get_collection_info()["count"] == 0
+
+    def test_invalid_dimension_raises(self):
+        with pytest.raises(ValueError):
+            FaissStore(dimension=0)
+
+    def test_mismatched_lengths_raise(self):
+        store = FaissStore(dimension=2)
+        with pytest.raises(ValueError):
+            store.add_documents(["a", "b"], [[1.0, 0.0]])
+
+
+class TestFaissStoreApproximate:
+    """Test the HNSW variant"""
+
+    def test_hnsw_index_uses_inner_product_metric(self):
+        store = FaissStore(dimension=2, approximate=True)
+        assert store._index.metric_type == faiss.METRIC_INNER_PRODUCT
+
+    def test_hnsw_scores_are_cosine(self):
+        store = make_store(approximate=True)
+        results = store.search([1.0, 0.0], limit=1)
+
+        # With L2 storage this would come back negative/huge, not ~1.0
+        assert results[0]["doc_id"] == "east"
+        assert results[0]["score"] == pytest.approx(1.0, abs=0.01)
+
+
+class TestFaissFactory:
+    """Test factory wiring for the faiss provider"""
+
+    def test_factory_creates_faiss_store(self):
+        config = VectorStoreConfig(provider="faiss", dimension=2)
+        store = create_vector_store(config)
+
+        assert isinstance(store, FaissStore)
+
+    def test_factory_requires_dimension(self):
+        config = VectorStoreConfig(provider="faiss")
+        with pytest.raises(ValueError):
+            create_vector_store(config)
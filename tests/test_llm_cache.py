@@ -0,0 +1,190 @@
+"""Tests for LLM client caching and async concurrency (stubbed SDK clients)"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.llm.kimi import KimiClient
+from src.llm.zhipu import ZhipuClient
+
+
+class FakeChatClient:
+    """Stand-in for the OpenAI SDK client that counts create() calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.requests = []
+        self.chat = SimpleNamespace(
+            completions=SimpleNamespace(create=self._create)
+        )
+
+    def _create(self, **kwargs):
+        self.calls += 1
+        self.requests.append(kwargs)
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(content=f"回答 {self.calls}")
+                )
+            ]
+        )
+
+
+class FakeAsyncChatClient:
+    """Async stand-in that tracks how many requests are in flight"""
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.chat = SimpleNamespace(
+            completions=SimpleNamespace(create=self._create)
+        )
+
+    async def _create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        # Yield a few times so concurrent tasks actually overlap
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.in_flight -= 1
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="回答"))]
+        )
+
+
+def make_kimi(**kwargs):
+    client = KimiClient(api_key="test-key", **kwargs)
+    fake = FakeChatClient()
+    client.client = fake
+    return client, fake
+
+
+def make_zhipu(monkeypatch):
+    # Skip the pooled httpx client and its prewarm thread; the stubbed
+    # async client is all these tests exercise
+    monkeypatch.setattr(
+        ZhipuClient, "_build_http_client", staticmethod(lambda: None)
+    )
+    client = ZhipuClient(api_key="test-key")
+    fake = FakeAsyncChatClient()
+    client._aclient = fake
+    return client, fake
+
+
+class TestKimiResponseCache:
+    """Test the (query, context) response cache of KimiClient"""
+
+    def test_zero_temperature_enables_cache(self):
+        client, _ = make_kimi(temperature=0)
+        assert client.cache_responses is True
+
+    def test_positive_temperature_disables_cache_by_default(self):
+        client, fake = make_kimi(temperature=0.6)
+        assert client.cache_responses is False
+
+        client.generate("问题", ["文档"])
+        client.generate("问题", ["文档"])
+        assert fake.calls == 2
+
+    def test_repeated_generate_served_from_cache(self):
+        client, fake = make_kimi(temperature=0)
+
+        first = client.generate("问题", ["文档"])
+        second = client.generate("问题", ["文档"])
+
+        assert fake.calls == 1
+        assert second == first
+
+    def test_different_context_misses_cache(self):
+        client, fake = make_kimi(temperature=0)
+
+        client.generate("问题", ["文档甲"])
+        client.generate("问题", ["文档乙"])
+
+        assert fake.calls == 2
+
+    def test_expired_entry_is_regenerated(self):
+        client, fake = make_kimi(temperature=0)
+        client.generate("问题", ["文档"])
+
+        # Age every cached entry past the TTL
+        for key, (timestamp, response) in list(client._response_cache.items()):
+            client._response_cache[key] = (
+                timestamp - KimiClient._CACHE_TTL - 1,
+                response,
+            )
+
+        client.generate("问题", ["文档"])
+        assert fake.calls == 2
+
+    def test_cache_size_is_bounded_lru(self):
+        client, fake = make_kimi(temperature=0)
+        client._CACHE_MAX_SIZE = 2
+
+        client.generate("问题一", ["文档"])
+        client.generate("问题二", ["文档"])
+        client.generate("问题三", ["文档"])
+        assert len(client._response_cache) == 2
+
+        # 问题一 was evicted as least recently used
+        client.generate("问题一", ["文档"])
+        assert fake.calls == 4
+
+    def test_history_is_part_of_the_cache_key(self):
+        client, fake = make_kimi(temperature=0)
+        history_a = [{"role": "user", "content": "你好"}]
+        history_b = [{"role": "user", "content": "再见"}]
+
+        client.generate_with_history("问题", ["文档"], history_a)
+        client.generate_with_history("问题", ["文档"], history_b)
+        assert fake.calls == 2
+
+        client.generate_with_history("问题", ["文档"], history_a)
+        assert fake.calls == 2
+
+
+class TestZhipuAsyncConcurrency:
+    """Test the per-event-loop semaphore of the async Zhipu path"""
+
+    def test_agenerate_survives_consecutive_event_loops(self, monkeypatch):
+        # Regression: a module-level semaphore binds to the first loop
+        # and makes the second asyncio.run() raise
+        client, fake = make_zhipu(monkeypatch)
+
+        async def batch():
+            return await asyncio.gather(
+                *(client.agenerate("问题", ["文档"]) for _ in range(4))
+            )
+
+        for _ in range(3):
+            responses = asyncio.run(batch())
+            assert responses == ["回答"] * 4
+
+        assert fake.calls == 12
+
+    def test_in_flight_requests_are_capped(self, monkeypatch):
+        client, fake = make_zhipu(monkeypatch)
+
+        async def batch():
+            await asyncio.gather(
+                *(client.agenerate("问题", ["文档"]) for _ in range(20))
+            )
+
+        asyncio.run(batch())
+
+        assert fake.calls == 20
+        assert fake.peak_in_flight <= 8
+
+    def test_agenerate_with_history(self, monkeypatch):
+        client, fake = make_zhipu(monkeypatch)
+        history = [{"role": "user", "content": "你好"}]
+
+        response = asyncio.run(
+            client.agenerate_with_history("问题", ["文档"], history)
+        )
+
+        assert response == "回答"
+        assert fake.calls == 1
@@ -0,0 +1,204 @@
+"""Tests for the long-context test framework and its semantic cache"""
+
+import pytest
+
+from src.rag.long_context_test import LongContextTest, SemanticLLMCache
+
+
+class FakeEmbedding:
+    """Deterministic embedder that only sees the first few characters
+
+    Mimics the input truncation of real embedding models, which is the
+    reason the semantic cache namespaces on the exact context instead of
+    trusting the embedding to tell long contexts apart.
+    """
+
+    dimension = 8
+
+    def encode(self, text):
+        window = text[:16]
+        vector = [0.0] * self.dimension
+        for index, char in enumerate(window):
+            vector[index % self.dimension] += float(ord(char) % 97) + 1.0
+        return vector
+
+
+class FakeLLM:
+    """LLM stub that counts how many calls reach the API"""
+
+    def __init__(self, temperature: float = 0.0):
+        self.temperature = temperature
+        self.calls = 0
+
+    def generate(self, query, context, system_prompt=None):
+        self.calls += 1
+        return f"秘密答案是：42（第 {self.calls} 次调用）"
+
+
+def make_tester(temperature: float = 0.0, embedding=FakeEmbedding()):
+    llm = FakeLLM(temperature=temperature)
+    tester = LongContextTest(llm, embedding=embedding)
+    return tester, llm
+
+
+class TestSemanticLLMCache:
+    """Test the namespaced semantic response cache directly"""
+
+    def test_invalid_threshold_raises(self):
+        with pytest.raises(ValueError):
+            SemanticLLMCache(FakeEmbedding(), similarity_threshold=0.0)
+        with pytest.raises(ValueError):
+            SemanticLLMCache(FakeEmbedding(), similarity_threshold=1.5)
+
+    def test_miss_then_hit_within_namespace(self):
+        cache = SemanticLLMCache(FakeEmbedding())
+        calls = []
+
+        first, hit_first = cache.get_or_generate(
+            "问题", lambda: calls.append(1) or "答案", namespace="ctx"
+        )
+        second, hit_second = cache.get_or_generate(
+            "问题", lambda: calls.append(1) or "另一个答案", namespace="ctx"
+        )
+
+        assert (first, hit_first) == ("答案", False)
+        assert (second, hit_second) == ("答案", True)
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_no_hits_across_namespaces(self):
+        cache = SemanticLLMCache(FakeEmbedding())
+
+        cache.get_or_generate("问题", lambda: "答案甲", namespace="ctx-a")
+        response, hit = cache.get_or_generate(
+            "问题", lambda: "答案乙", namespace="ctx-b"
+        )
+
+        assert (response, hit) == ("答案乙", False)
+        assert len(cache) == 2
+
+
+class TestBuildContext:
+    """Test context construction and validation"""
+
+    def test_invalid_context_size_raises(self):
+        tester, _ = make_tester()
+        with pytest.raises(ValueError):
+            tester.build_context("针", context_size=0, depth_percent=50)
+
+    def test_invalid_depth_raises(self):
+        tester, _ = make_tester()
+        with pytest.raises(ValueError):
+            tester.build_context("针", context_size=1000, depth_percent=101)
+
+    def test_needle_at_depth_zero_leads_the_context(self):
+        tester, _ = make_tester()
+        context = tester.build_context("秘密答案是：42", 1000, depth_percent=0)
+        assert context.startswith("秘密答案是：42")
+
+    def test_needle_at_depth_hundred_ends_the_context(self):
+        tester, _ = make_tester()
+        context = tester.build_context("秘密答案是：42", 1000, depth_percent=100)
+        assert context.endswith("秘密答案是：42")
+
+
+class TestLongContextCacheBehavior:
+    """Test how run_test routes LLM calls through the semantic cache"""
+
+    def test_repeated_trial_is_served_from_cache(self):
+        tester, llm = make_tester()
+        kwargs = dict(
+            needle="秘密答案是：42",
+            context_size=1000,
+            depth_percent=50,
+            question="秘密答案是什么？",
+            expected_answer="42",
+        )
+
+        first = tester.run_test(**kwargs)
+        second = tester.run_test(**kwargs)
+
+        assert llm.calls == 1
+        assert first["cache_hit"] is False
+        assert second["cache_hit"] is True
+        assert second["response"] == first["response"]
+        assert second["needle_found"] is True
+
+    def test_different_cells_never_share_an_answer(self):
+        # The embedder truncates the question to a handful of characters,
+        # so only the context-hash namespace keeps these cells apart
+        tester, llm = make_tester()
+
+        for depth in (0, 50, 100):
+            result = tester.run_test(
+                needle="秘密答案是：42",
+                context_size=1000,
+                depth_percent=depth,
+                question="秘密答案是什么？",
+            )
+            assert result["cache_hit"] is False
+
+        assert llm.calls == 3
+
+    def test_different_system_prompts_never_share_an_answer(self):
+        tester, llm = make_tester()
+        kwargs = dict(
+            needle="秘密答案是：42",
+            context_size=1000,
+            depth_percent=50,
+            question="秘密答案是什么？",
+        )
+
+        tester.run_test(system_prompt="用中文回答", **kwargs)
+        result = tester.run_test(system_prompt="用英文回答", **kwargs)
+
+        assert result["cache_hit"] is False
+        assert llm.calls == 2
+
+    def test_high_temperature_disables_cache(self):
+        tester, llm = make_tester(temperature=0.7)
+        kwargs = dict(
+            needle="秘密答案是：42",
+            context_size=1000,
+            depth_percent=50,
+            question="秘密答案是什么？",
+        )
+
+        tester.run_test(**kwargs)
+        result = tester.run_test(**kwargs)
+
+        assert result["cache_hit"] is False
+        assert llm.calls == 2
+        assert tester.cache_hits == 0
+
+    def test_no_embedding_disables_cache(self):
+        llm = FakeLLM()
+        tester = LongContextTest(llm)
+        kwargs = dict(
+            needle="秘密答案是：42",
+            context_size=1000,
+            depth_percent=50,
+            question="秘密答案是什么？",
+        )
+
+        tester.run_test(**kwargs)
+        result = tester.run_test(**kwargs)
+
+        assert result["cache_hit"] is False
+        assert llm.calls == 2
+
+    def test_matrix_only_pays_one_call_per_cell(self):
+        tester, llm = make_tester()
+
+        results = tester.run_multiple_tests(
+            needle="秘密答案是：42",
+            context_sizes=[1000, 2000],
+            depth_percents=[0, 100],
+            trials_per_config=3,
+            question="秘密答案是什么？",
+        )
+
+        assert len(results) == 12
+        assert llm.calls == 4
+        assert tester.cache_hits == 8
+        assert [r["trial"] for r in results[:3]] == [0, 1, 2]
@@ -0,0 +1,175 @@
+"""Tests for the in-memory NumPy vector store"""
+
+import pytest
+
+from src.rag.stores.numpy_store import NumPyStore
+
+
+def make_store(**kwargs):
+    store = NumPyStore(collection_name="test_collection", **kwargs)
+    store.add_documents(
+        documents=["东", "北", "东北"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]],
+        metadatas=[{"axis": "x"}, {"axis": "y"}, None],
+        ids=["east", "north", "northeast"],
+    )
+    return store
+
+
+class TestNumPyStoreSearch:
+    """Test search behavior of the float32 store"""
+
+    def test_search_orders_by_cosine_score(self):
+        store = make_store()
+        results = store.search([1.0, 0.1], limit=3)
+
+        assert [r["doc_id"] for r in results] == ["east", "northeast", "north"]
+        scores = [r["score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
+        assert results[0]["score"] == pytest.approx(1.0, abs=0.01)
+
+    def test_search_respects_limit(self):
+        store = make_store()
+        assert len(store.search([1.0, 0.0], limit=2)) == 2
+
+    def test_search_score_threshold(self):
+        store = make_store()
+        results = store.search([1.0, 0.0], limit=3, score_threshold=0.9)
+
+        assert [r["doc_id"] for r in results] == ["east"]
+
+    def test_search_metadata_filter(self):
+        store = make_store()
+        results = store.search([1.0, 0.0], limit=3, filter_metadata={"axis": "y"})
+
+        assert [r["doc_id"] for r in results] == ["north"]
+
+    def test_search_empty_store_returns_empty(self):
+        store = NumPyStore()
+        assert store.search([1.0, 0.0]) == []
+
+    def test_search_empty_query_raises(self):
+        store = make_store()
+        with pytest.raises(ValueError):
+            store.search([])
+
+    def test_search_batch_matches_single_search(self):
+        store = make_store()
+        queries = [[1.0, 0.0], [0.0, 1.0]]
+        batched = store.search_batch(queries, limit=3)
+        singles = [store.search(q, limit=3) for q in queries]
+
+        assert len(batched) == 2
+        for batch_results, single_results in zip(batched, singles):
+            assert [r["doc_id"] for r in batch_results] == [
+                r["doc_id"] for r in single_results
+            ]
+
+
+class TestNumPyStoreQuantization:
+    """Test int8/float16 storage quantization"""
+
+    def test_unsupported_quantization_raises(self):
+        with pytest.raises(ValueError):
+            NumPyStore(quantization="int4")
+
+    @pytest.mark.parametrize("quantization", ["int8", "float16"])
+    def test_quantized_search_matches_float_ordering(self, quantization):
+        full = make_store()
+        quantized = make_store(quantization=quantization)
+        query = [0.9, 0.2]
+
+        full_ids = [r["doc_id"] for r in full.search(query, limit=3)]
+        quant_results = quantized.search(query, limit=3)
+
+        assert [r["doc_id"] for r in quant_results] == full_ids
+        # Quantized cosine scores stay close to the float32 ones
+        for quant, exact in zip(quant_results, full.search(query, limit=3)):
+            assert quant["score"] == pytest.approx(exact["score"], abs=0.05)
+
+    def test_int8_delete_keeps_scales_aligned(self):
+        store = make_store(quantization="int8")
+        store.delete_documents(["east"])
+
+        results = store.search([0.0, 1.0], limit=3)
+        assert [r["doc_id"] for r in results] == ["north", "northeast"]
+
+
+class TestNumPyStoreLifecycle:
+    """Test delete/reset/info behavior"""
+
+    def test_delete_documents(self):
+        store = make_store()
+        store.delete_documents(["northeast"])
+
+        assert store.document_count == 2
+        assert [r["doc_id"] for r in store.search([0.7, 0.7], limit=3)] == [
+            "east", "north",
+        ] or [r["doc_id"] for r in store.search([0.7, 0.7], limit=3)] == [
+            "north", "east",
+        ]
+
+    def test_delete_all_documents_empties_store(self):
+        store = make_store()
+        store.delete_documents(["east", "north", "northeast"])
+
+        assert store.document_count == 0
+        assert store.search([1.0, 0.0]) == []
+
+    def test_reset(self):
+        store = make_store()
+        store.reset()
+
+        assert store.document_count == 0
+        assert store.get_collection_info()["count"] == 0
+
+    def test_mismatched_lengths_raise(self):
+        store = NumPyStore()
+        with pytest.raises(ValueError):
+            store.add_documents(["a", "b"], [[1.0, 0.0]])
+
+    def test_collection_info(self):
+        store = make_store()
+        info = store.get_collection_info()
+
+        assert info["name"] == "test_collection"
+        assert info["count"] == 3
+
+
+class TestNumPyStorePersistence:
+    """Test save/load round-trips (eager and mmap)"""
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_save_load_round_trip(self, tmp_path, mmap):
+        store = make_store()
+        store.save(tmp_path)
+
+        loaded = NumPyStore.load(tmp_path, mmap=mmap)
+
+        assert loaded.document_count == 3
+        assert loaded.collection_name == "test_collection"
+        results = loaded.search([1.0, 0.0], limit=1)
+        assert results[0]["doc_id"] == "east"
+        assert results[0]["metadata"] == {"axis": "x"}
+
+    def test_save_load_int8_round_trip(self, tmp_path):
+        store = make_store(quantization="int8")
+        store.save(tmp_path)
+
+        loaded = NumPyStore.load(tmp_path)
+
+        assert loaded.search([1.0, 0.0], limit=1)[0]["doc_id"] == "east"
+
+    def test_load_missing_directory_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            NumPyStore.load(tmp_path / "nothing_here")
+
+    def test_loaded_store_accepts_new_documents(self, tmp_path):
+        store = make_store()
+        store.save(tmp_path)
+
+        loaded = NumPyStore.load(tmp_path)
+        loaded.add_documents(["南"], [[0.0, -1.0]], ids=["south"])
+
+        assert loaded.document_count == 4
+        assert loaded.search([0.0, -1.0], limit=1)[0]["doc_id"] == "south"